@@ -1,7 +1,44 @@
 from __future__ import annotations
 
 import re
-from typing import Optional
+from itertools import chain, islice
+from typing import Optional, Sequence
+
+# 설정에서 읽은 문자열 패턴 또는 미리 컴파일해 둔 패턴
+PatternList = Sequence["str | re.Pattern[str]"]
+
+# 번호 역참조가 있는 패턴은 하나로 합치면 그룹 번호가 밀려 뜻이 바뀐다.
+_BACKREFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=")
+_LEADING_NUMBER_DECORATION_RE = re.compile(r"^\s*[★☆※＊*]+\s*")
+_NUMBER_DECORATION_CHARS = frozenset("★☆※＊*")
+_DIGITS_RE = re.compile(r"\d{1,2}")
+_FALLBACK_ANSWER_RE = re.compile(
+    r"^\s*[\[\(【]?\s*정답\s*[\]\)】]?\s*[:：]?\s*[\(\[]?\s*[①②③④⑤1-5]\s*[\)\]]?\s*(?:번)?(\s*[\(\[][^\)\]]++[\)\]])?\s*$"
+)
+_GROUPED_ANSWER_RE = re.compile(r"^\s*[①②③④⑤1-5]\s*[\(\[][^\)\]]++[\)\]]\s*$")
+_PLAIN_ANSWER_RE = re.compile(r"^\s*[\(\[]?\s*[①②③④⑤1-5]\s*[\)\]]?\s*$")
+_MARKER_RE = re.compile(r"^\s*[\[\(【]?\s*(정답|해설)\s*[\]\)】]?\s*[:：]?\s*$")
+_EXPLANATION_HINT_RE = re.compile(r"^\s*[\[\(【]?\s*(해설|참고|핵심정리|관련\s*판례)\s*[\]\)】]?\s*[:：]?")
+# 위 내장 정규식이 맞을 수 있는 첫 글자(앞 공백 제외). 나머지 줄은 정규식 없이 건너뛴다.
+_ANSWER_LINE_FIRSTS = frozenset("[(【정①②③④⑤12345")
+_EXPLANATION_HINT_FIRSTS = frozenset("[(【해참핵관")
+_WHITESPACE_RE = re.compile(r"\s+")
+# 부정 표현 규칙: (패턴, 강조할 그룹). 여러 규칙이 맞으면 그룹이 가장 앞선 것을 고른다.
+_NEGATIVE_TOKEN_RULES = (
+    (re.compile(r"(아닌)\s*것"), 1),
+    (re.compile(r"(않은)\s*것"), 1),
+    (re.compile(r"(?:옳지|적절하지|올바르지|가장\s*적절하지|가장\s*옳지)\s*(않은)"), 1),
+    (re.compile(r"(아니한)"), 1),
+    (re.compile(r"(잘못된)"), 1),
+    (re.compile(r"(부적절\s*한|부절절)"), 1),
+    (re.compile(r"(틀린)"), 1),
+)
+# Defensive fallback for custom/legacy pattern lists in user config.
+_FALLBACK_QUESTION_NUMBER_RES = (
+    re.compile(r"^\s*(\d{1,2})\s*[\.\)]\s*"),
+    re.compile(r"^\s*(\d{1,2})\s+(?=[가-힣A-Za-z<\[\(])"),
+    re.compile(r"^\s*문\s*(\d{1,2})\s*[\.\)]?\s*"),
+)
 
 
 DEFAULT_QUESTION_PATTERNS = [
@@ -47,9 +84,13 @@ DEFAULT_NEGATIVE_KEYWORDS = [
 ]
 
 
-def _compile_patterns(patterns: list[str]) -> list[re.Pattern[str]]:
+def compile_patterns(patterns: PatternList) -> list[re.Pattern[str]]:
+    """패턴 목록을 컴파일한다. 이미 컴파일된 항목은 그대로 쓰고 잘못된 패턴은 건너뛴다."""
     compiled: list[re.Pattern[str]] = []
     for pattern in patterns:
+        if isinstance(pattern, re.Pattern):
+            compiled.append(pattern)
+            continue
         try:
             compiled.append(re.compile(pattern))
         except re.error:
@@ -57,6 +98,25 @@ def _compile_patterns(patterns: list[str]) -> list[re.Pattern[str]]:
     return compiled
 
 
+def merge_patterns(patterns: PatternList) -> list[re.Pattern[str]]:
+    """매칭 여부만 필요한 패턴 목록을 하나의 대안식으로 합친다.
+
+    합칠 수 없으면(역참조, 중간 인라인 플래그, 그룹 이름 충돌 등) 개별 컴파일 결과를 돌려준다.
+    """
+    compiled = compile_patterns(patterns)
+    if len(compiled) < 2:
+        return compiled
+    sources = [pattern.pattern for pattern in compiled]
+    if any(pattern.flags & ~re.UNICODE for pattern in compiled):
+        return compiled
+    if any(_BACKREFERENCE_RE.search(source) for source in sources):
+        return compiled
+    try:
+        return [re.compile("|".join(f"(?:{source})" for source in sources))]
+    except re.error:
+        return compiled
+
+
 def detect_file_type(
     text_blocks: list[str],
     answer_patterns: Optional[list[str]] = None,
@@ -64,41 +124,35 @@ def detect_file_type(
     question_patterns: Optional[list[str]] = None,
     explanation_patterns: Optional[list[str]] = None,
 ) -> str:
-    patterns = _compile_patterns(answer_patterns or DEFAULT_ANSWER_PATTERNS)
-    question_compiled = _compile_patterns(question_patterns or DEFAULT_QUESTION_PATTERNS)
-    explanation_compiled = _compile_patterns(explanation_patterns or DEFAULT_EXPLANATION_PATTERNS)
-    fallback_answer_pattern = re.compile(
-        r"^\s*[\[\(【]?\s*정답\s*[\]\)】]?\s*[:：]?\s*[\(\[]?\s*[①②③④⑤1-5]\s*[\)\]]?\s*(?:번)?(\s*[\(\[][^\)\]]+[\)\]])?\s*$"
-    )
-    grouped_answer_pattern = re.compile(r"^\s*[①②③④⑤1-5]\s*[\(\[][^\)\]]+[\)\]]\s*$")
-    plain_answer_pattern = re.compile(r"^\s*[\(\[]?\s*[①②③④⑤1-5]\s*[\)\]]?\s*$")
-    marker_pattern = re.compile(r"^\s*[\[\(【]?\s*(정답|해설)\s*[\]\)】]?\s*[:：]?\s*$")
-    explanation_hint_pattern = re.compile(
-        r"^\s*[\[\(【]?\s*(해설|참고|핵심정리|관련\s*판례)\s*[\]\)】]?\s*[:：]?"
-    )
+    patterns = merge_patterns(answer_patterns or DEFAULT_ANSWER_PATTERNS)
+    question_compiled = merge_patterns(question_patterns or DEFAULT_QUESTION_PATTERNS)
+    explanation_compiled = merge_patterns(explanation_patterns or DEFAULT_EXPLANATION_PATTERNS)
     answer_count = 0
     explanation_count = 0
     question_count = 0
-    for index, block in enumerate(text_blocks):
+    for block, next_block in zip(text_blocks, chain(islice(text_blocks, 1, None), ("",))):
         stripped = (block or "").strip()
         if not stripped:
             continue
 
-        if any(pattern.match(stripped) for pattern in question_compiled) and re.search(r"[?？]", stripped):
+        if ("?" in stripped or "？" in stripped) and any(pattern.match(stripped) for pattern in question_compiled):
             question_count += 1
 
+        first = stripped[0]
         if any(pattern.match(block) for pattern in patterns):
             answer_count += 1
             continue
-        if fallback_answer_pattern.match(block) or grouped_answer_pattern.match(block):
-            answer_count += 1
-            continue
-        if plain_answer_pattern.match(block):
-            next_block = text_blocks[index + 1] if index + 1 < len(text_blocks) else ""
-            if marker_pattern.match(next_block):
+        if first in _ANSWER_LINE_FIRSTS:
+            if _FALLBACK_ANSWER_RE.match(block) or _GROUPED_ANSWER_RE.match(block):
                 answer_count += 1
+                continue
+            if _PLAIN_ANSWER_RE.match(block):
+                if _MARKER_RE.match(next_block):
+                    answer_count += 1
 
-        if any(pattern.match(stripped) for pattern in explanation_compiled) or explanation_hint_pattern.match(stripped):
+        if any(pattern.match(stripped) for pattern in explanation_compiled) or (
+            first in _EXPLANATION_HINT_FIRSTS and _EXPLANATION_HINT_RE.match(stripped)
+        ):
             explanation_count += 1
 
     adaptive_threshold = max(1, int(threshold))
@@ -113,44 +167,66 @@ def detect_file_type(
     return "TYPE_B"
 
 
+def _question_number_from_match(match: re.Match[str], normalized_text: str) -> Optional[int]:
+    remainder = normalized_text[match.end():]
+    if remainder and remainder[:1].isdigit():
+        # e.g. "0.03%" should not be interpreted as question number "0."
+        return None
+    for group in match.groups():
+        if group and group.isdigit():
+            number = int(group)
+            if number <= 0:
+                continue
+            return number
+    digits = _DIGITS_RE.search(match.group(0))
+    if digits:
+        number = int(digits.group(0))
+        if number > 0:
+            return number
+    return None
+
+
 def extract_question_number(
     text: str,
-    question_patterns: Optional[list[str]] = None,
+    question_patterns: Optional[PatternList] = None,
+    combined_pattern: Optional[re.Pattern[str]] = None,
 ) -> Optional[int]:
-    normalized_text = re.sub(r"^\s*[★☆※＊*]+\s*", "", text)
-    patterns = _compile_patterns(question_patterns or DEFAULT_QUESTION_PATTERNS)
-    for pattern in patterns:
-        match = pattern.match(normalized_text)
-        if not match:
-            continue
-        remainder = normalized_text[match.end():]
-        if remainder and remainder[:1].isdigit():
-            # e.g. "0.03%" should not be interpreted as question number "0."
-            continue
-        for group in match.groups():
-            if group and group.isdigit():
-                number = int(group)
-                if number <= 0:
-                    continue
+    """문항 번호를 찾는다.
+
+    combined_pattern은 question_patterns를 merge_patterns로 합친 정규식이다. 합친 식의
+    첫 매칭은 목록에서 처음 맞는 패턴의 매칭과 같으므로, 그 결과가 쓸 만하면 바로 돌려주고
+    아니면 패턴별로 다시 확인한다. 아무 패턴도 맞지 않으면 패턴별 확인을 건너뛴다.
+    """
+    first = text.lstrip()[:1]
+    if first in _NUMBER_DECORATION_CHARS:
+        normalized_text = _LEADING_NUMBER_DECORATION_RE.sub("", text, count=1)
+        first = normalized_text.lstrip()[:1]
+    else:
+        normalized_text = text
+    scan_each_pattern = True
+    if combined_pattern is not None:
+        match = combined_pattern.match(normalized_text)
+        if match:
+            number = _question_number_from_match(match, normalized_text)
+            if number is not None:
                 return number
-        digits = re.search(r"\d{1,2}", match.group(0))
-        if digits:
-            number = int(digits.group(0))
-            if number <= 0:
+        else:
+            scan_each_pattern = False
+
+    if scan_each_pattern:
+        for pattern in compile_patterns(question_patterns or DEFAULT_QUESTION_PATTERNS):
+            match = pattern.match(normalized_text)
+            if not match:
                 continue
-            return number
+            number = _question_number_from_match(match, normalized_text)
+            if number is not None:
+                return number
 
-    # Defensive fallback for custom/legacy pattern lists in user config.
-    fallback_patterns = [
-        r"^\s*(\d{1,2})\s*[\.\)]\s*",
-        r"^\s*(\d{1,2})\s+(?=[가-힣A-Za-z<\[\(])",
-        r"^\s*문\s*(\d{1,2})\s*[\.\)]?\s*",
-    ]
-    for raw in fallback_patterns:
-        try:
-            match = re.match(raw, normalized_text)
-        except re.error:
-            match = None
+    # 대체 패턴은 모두 숫자나 "문"으로 시작하는 줄에만 맞는다.
+    if not (first.isdecimal() or first == "문"):
+        return None
+    for pattern in _FALLBACK_QUESTION_NUMBER_RES:
+        match = pattern.match(normalized_text)
         if not match:
             continue
         digits = match.group(1)
@@ -162,8 +238,8 @@ def extract_question_number(
     return None
 
 
-def is_line_matching(text: str, patterns: list[str]) -> bool:
-    for pattern in _compile_patterns(patterns):
+def is_line_matching(text: str, patterns: PatternList) -> bool:
+    for pattern in compile_patterns(patterns):
         if pattern.match(text):
             return True
     return False
@@ -183,7 +259,7 @@ def detect_negative_keyword(text: str, keywords: Optional[list[str]] = None) ->
 
 
 def _map_negative_emphasis_token(text: str, keyword: str, index: int) -> str:
-    compact = re.sub(r"\s+", "", keyword)
+    compact = _WHITESPACE_RE.sub("", keyword)
 
     def _segment() -> str:
         end = index + len(keyword)
@@ -216,19 +292,9 @@ def _map_negative_emphasis_token(text: str, keyword: str, index: int) -> str:
 
 
 def _detect_negative_token_by_rule(text: str) -> str:
-    rules = [
-        (r"(아닌)\s*것", 1),
-        (r"(않은)\s*것", 1),
-        (r"(?:옳지|적절하지|올바르지|가장\s*적절하지|가장\s*옳지)\s*(않은)", 1),
-        (r"(아니한)", 1),
-        (r"(잘못된)", 1),
-        (r"(부적절\s*한|부절절)", 1),
-        (r"(틀린)", 1),
-    ]
-
     best: tuple[int, str] | None = None
-    for pattern, group in rules:
-        match = re.search(pattern, text)
+    for pattern, group in _NEGATIVE_TOKEN_RULES:
+        match = pattern.search(text)
         if not match:
             continue
         token = match.group(group)
@@ -1,5 +1,7 @@
 ﻿from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 import os
@@ -25,6 +27,75 @@ except ImportError:  # pragma: no cover - non-Windows
     winreg = None
 
 
+# 파일명에서 제거할 제어 문자(C0/DEL/C1)와 서로게이트 코드포인트
+_FILENAME_STRIP_TABLE = dict.fromkeys(
+    [*range(0x00, 0x20), *range(0x7F, 0xA0), *range(0xD800, 0xE000)],
+    None,
+)
+# HWP 프로세스 종료 대기(tasklist 폴링)를 바이너리 후처리와 겹쳐 실행한다.
+_PROCESS_EXIT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hwp-exit")
+_INVALID_FILENAME_CHARS_RE = re.compile(r'[\\/:*?"<>|]+')
+_WHITESPACE_RE = re.compile(r"\s+")
+_SPACE_RUN_RE = re.compile(r"[ ]+")
+_EOL_RE = re.compile(r"\r\n?|\n")
+_CHOICE_MARKER_ANY_RE = re.compile(r"[①②③④⑤]")
+_CHOICE_MARKERS = frozenset("①②③④⑤")
+# 한 줄로 합친 선지 사이 간격 (공백 9칸)
+_CHOICE_SEP = " " * 9
+_CHOICE_MARKER_LINE_RE = re.compile(r"^[①②③④⑤]\s*")
+# 표 컨텍스트 이탈 시 probe + CloseEx/Cancel 반복 상한
+_TABLE_LEAVE_MAX_ROUNDS = 3
+# OLE 추출 노이즈가 선지 끝에 1글자로 끼는 코드포인트 (예: U+3C72, U+2C86, U+4546)
+_CHOICE_NOISE_CODEPOINTS = frozenset(
+    [
+        *range(0x0370, 0x0400),  # Greek
+        *range(0x2C80, 0x2D00),  # Coptic
+        *range(0x3400, 0x4DC0),  # CJK Extension A
+    ]
+)
+
+
+@dataclass(frozen=True)
+class _OutputPaths:
+    question_hwp: Path
+    explanation_hwp: Path
+    question_txt: Path
+    explanation_txt: Path
+
+    @classmethod
+    def build(cls, directory: Path, stem: str, timestamp: str) -> "_OutputPaths":
+        question_stem = f"{stem}_question_sheet_{timestamp}"
+        explanation_stem = f"{stem}_explanation_sheet_{timestamp}"
+        return cls(
+            question_hwp=directory / f"{question_stem}.hwp",
+            explanation_hwp=directory / f"{explanation_stem}.hwp",
+            question_txt=directory / f"{question_stem}.txt",
+            explanation_txt=directory / f"{explanation_stem}.txt",
+        )
+
+
+class _TextBuffer:
+    """서식 변경 없이 이어지는 텍스트를 모아 InsertText 한 번으로 입력한다.
+
+    서식(apply_*)을 바꾸기 직전에는 반드시 flush해야 한다.
+    """
+
+    def __init__(self, insert: Callable[[Any, str], None]) -> None:
+        self._insert = insert
+        self._parts: list[str] = []
+
+    def write(self, text: str) -> None:
+        if text:
+            self._parts.append(text)
+
+    def flush(self, hwp) -> None:
+        if not self._parts:
+            return
+        text = "".join(self._parts)
+        self._parts.clear()
+        self._insert(hwp, text)
+
+
 class OutputGenerator:
     def __init__(self, config: dict[str, Any]) -> None:
         self.config = config
@@ -38,9 +109,22 @@ class OutputGenerator:
             self._template_path_raw = str(self.style_config.get("style_map_source", "")).strip()
         self._resolved_template_path: Path | None = None
         self._run_warnings: list[str] = []
+        self._run_warnings_seen: set[str] = set()
         self._file_path_module_name = self._detect_file_path_check_module_name()
         self._module_dll_hint = str(self.style_config.get("module_dll_path", "")).strip()
+        # 본문이 비어 있는 스타일 전용 템플릿이면 SelectAll/Delete 왕복을 생략한다.
+        self._template_body_empty = bool(self.style_config.get("template_body_empty", False))
+        # FileSaveAs 파라미터를 속성 대입 + SetItem 모두로 채우는 구버전 호환 경로
+        self._com_compat_mode = bool(self.style_config.get("com_compat_mode", False))
         self._last_hwp_error: str = ""
+        self._module_registered = False
+        self._message_box_modes: dict[int, int] = {}
+        self._com_handles: dict[tuple[int, str], Any] = {}
+        # 소문항 표를 만든 뒤 아직 빠져나오지 않았는지 추적한다.
+        self._in_table_context = False
+        # 소문항 표 너비는 문서 단위로 고정이라 mm/HWP 단위 모두 한 번만 계산한다.
+        self._cached_sub_items_table_width_mm: float | None = None
+        self._cached_sub_items_table_width_hwp: int | None = None
         self._on_progress: ProgressCallback = None
         self._progress_pct: int = 0
         self._use_sub_items_table = bool(config.get("format", {}).get("sub_items_table", True))
@@ -55,12 +139,16 @@ class OutputGenerator:
             except Exception:
                 pass
 
-    def _heartbeat(self, msg: str) -> None:
-        if self._on_progress:
-            try:
-                self._on_progress(self._progress_pct, msg)
-            except Exception:
-                pass
+    def _heartbeat(self, msg: str, *args: Any) -> None:
+        # 진행 콜백이 없을 때는 메시지 포맷팅도 하지 않는다 (logging과 같은 지연 포맷).
+        if not self._on_progress:
+            return
+        if args:
+            msg = msg % args
+        try:
+            self._on_progress(self._progress_pct, msg)
+        except Exception:
+            pass
 
     def generate(self, document: ExamDocument, output_dir: str, source_stem: str, on_progress: ProgressCallback = None) -> list[str]:
         self._on_progress = on_progress
@@ -70,6 +158,7 @@ class OutputGenerator:
         self.formatter.use_styles = self._base_style_enabled
         self.formatter.reset_style_runtime_warnings()
         self._run_warnings = []
+        self._run_warnings_seen = set()
         self._last_hwp_error = ""
         self._resolved_template_path = self._resolve_template_path() if self._base_style_enabled else None
         if self._base_style_enabled:
@@ -96,10 +185,13 @@ class OutputGenerator:
         output_path.mkdir(parents=True, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         safe_stem = self._sanitize_filename_component(source_stem)
+        paths = _OutputPaths.build(output_path, safe_stem, timestamp)
+        # 파일명 문제로 TXT 저장이 실패할 때 사용할 기본 경로
+        fallback_paths = _OutputPaths.build(output_path, "exam", timestamp)
 
         if on_progress:
             self._set_progress(2, "HWP 출력 준비 중...")
-        hwp_files = self._try_generate_hwp(document, output_path, safe_stem, timestamp, on_progress)
+        hwp_files = self._try_generate_hwp(document, paths, on_progress)
         for warning in self.formatter.style_runtime_warnings:
             self._warn(warning)
         if style_required and self.formatter.style_runtime_warnings:
@@ -125,7 +217,7 @@ class OutputGenerator:
             details = self._last_hwp_error or "\n".join(self._run_warnings)
             raise RuntimeError(details or "스타일 필수 모드에서 HWP 출력 생성에 실패했습니다.")
         self._warn("\uD55C\uAE00(HWP) \uCD9C\uB825 \uC0DD\uC131\uC744 \uC2E4\uD589\uD558\uC9C0 \uBABB\uD574 .txt \uB300\uCCB4 \uCD9C\uB825\uC73C\uB85C \uC804\uD658\uD588\uC2B5\uB2C8\uB2E4.")
-        generated = self._generate_txt_fallback(document, output_path, safe_stem, timestamp)
+        generated = self._generate_txt_fallback(document, paths, fallback_paths)
         self.last_warning = "\n".join(self._run_warnings).strip()
         return generated
 
@@ -139,10 +231,9 @@ class OutputGenerator:
 
     def _sanitize_filename_component(self, value: str) -> str:
         text = unicodedata.normalize("NFKC", value or "")
-        text = "".join(ch for ch in text if unicodedata.category(ch) != "Cs")
-        text = "".join(ch for ch in text if ord(ch) >= 32 and not (127 <= ord(ch) <= 159))
-        text = re.sub(r'[\\/:*?"<>|]+', "_", text)
-        text = re.sub(r"\s+", " ", text).strip().strip(".")
+        text = text.translate(_FILENAME_STRIP_TABLE)
+        text = _INVALID_FILENAME_CHARS_RE.sub("_", text)
+        text = _WHITESPACE_RE.sub(" ", text).strip().strip(".")
         if not text:
             return "exam"
 
@@ -157,7 +248,8 @@ class OutputGenerator:
 
     def _warn(self, message: str) -> None:
         text = message.strip()
-        if text and text not in self._run_warnings:
+        if text and text not in self._run_warnings_seen:
+            self._run_warnings_seen.add(text)
             self._run_warnings.append(text)
 
     def _collect_style_config_warnings(self) -> list[str]:
@@ -241,9 +333,16 @@ class OutputGenerator:
         return candidates[0] if candidates else None
 
     def _candidate_file_path_module_dll_paths(self) -> list[Path]:
+        # glob 결과는 절대 경로라 resolve 없이 그대로 중복 키로 쓴다.
+        # 사용자 입력 힌트만 resolve로 정규화한다.
         candidates: list[Path] = []
         if self._module_dll_hint:
-            candidates.append(Path(self._module_dll_hint).expanduser())
+            hint = Path(self._module_dll_hint).expanduser()
+            try:
+                hint = hint.resolve()
+            except Exception:
+                pass
+            candidates.append(hint)
 
         install_roots: list[Path] = []
         for env_key in ("ProgramFiles(x86)", "ProgramFiles"):
@@ -264,13 +363,10 @@ class OutputGenerator:
         deduped: list[Path] = []
         seen: set[str] = set()
         for path in candidates:
-            try:
-                resolved = str(path.resolve())
-            except Exception:
-                resolved = str(path)
-            if resolved in seen:
+            key = str(path)
+            if key in seen:
                 continue
-            seen.add(resolved)
+            seen.add(key)
             deduped.append(path)
         return deduped
 
@@ -322,12 +418,9 @@ class OutputGenerator:
             return existing[0][0], existing[0][1], False
 
         for dll_path in self._candidate_file_path_module_dll_paths():
-            try:
-                resolved = str(dll_path.expanduser().resolve())
-            except Exception:
-                resolved = str(dll_path)
-            if not Path(resolved).exists():
+            if not dll_path.exists():
                 continue
+            resolved = str(dll_path)
             wrote = False
             for key_path in key_paths:
                 try:
@@ -384,9 +477,7 @@ class OutputGenerator:
     def _try_generate_hwp(
         self,
         document: ExamDocument,
-        output_path: Path,
-        source_stem: str,
-        timestamp: str,
+        paths: _OutputPaths,
         on_progress: ProgressCallback = None,
     ) -> list[str]:
         if win32 is None:
@@ -394,47 +485,69 @@ class OutputGenerator:
             return []
 
         is_type_a = document.file_type == "TYPE_A"
-        generated: list[str] = []
-        question_file = output_path / f"{source_stem}_question_sheet_{timestamp}.hwp"
-        if self._write_question_sheet_hwp(question_file, document, on_progress, is_type_a):
-            generated.append(str(question_file))
-        else:
-            return []
+        saved: list[Path] = []
+        failed = False
+        hwp = None
+        # 문제지/해설지는 하나의 HWP 인스턴스를 재사용한다.
+        # (Dispatch + RegisterModule + 템플릿 열기는 시트당 수 초가 걸린다.)
+        try:
+            if on_progress:
+                self._set_progress(5, "문제지 HWP 열는 중...")
+            hwp = self._open_hwp_document(target_path=paths.question_hwp)
+            self._write_question_sheet_hwp(hwp, paths.question_hwp, document, on_progress, is_type_a)
+            saved.append(paths.question_hwp)
+
+            if is_type_a:
+                if on_progress:
+                    self._set_progress(55, "해설지 HWP 열는 중...")
+                self._reopen_hwp_document(hwp, target_path=paths.explanation_hwp)
+                self._write_explanation_sheet_hwp(hwp, paths.explanation_hwp, document, on_progress)
+                saved.append(paths.explanation_hwp)
+        except Exception as exc:
+            self._last_hwp_error = str(exc)
+            failed = True
+        finally:
+            exit_wait = self._quit_hwp(hwp, background_wait=True)
 
-        if is_type_a:
-            explanation_file = output_path / f"{source_stem}_explanation_sheet_{timestamp}.hwp"
-            if self._write_explanation_sheet_hwp(explanation_file, document, on_progress):
-                generated.append(str(explanation_file))
-            else:
-                return []
+        # COM 종료 후 바이너리 후처리로 style_id 설정
+        # (프로세스 종료 확인은 백그라운드에서 진행된다)
+        try:
+            for path in saved:
+                if path == paths.question_hwp:
+                    self._post_process_question_sheet(path)
+                else:
+                    self._post_process_explanation_sheet(path)
+        finally:
+            if exit_wait is not None:
+                exit_wait.result()
+        if failed:
+            return []
 
         if on_progress:
             on_progress(100, "완료")
-        return generated
+        return [str(path) for path in saved]
 
     def _generate_txt_fallback(
         self,
         document: ExamDocument,
-        output_path: Path,
-        source_stem: str,
-        timestamp: str,
+        paths: _OutputPaths,
+        fallback_paths: _OutputPaths,
     ) -> list[str]:
-        safe_stem = self._sanitize_filename_component(source_stem)
-        question_file = output_path / f"{safe_stem}_question_sheet_{timestamp}.txt"
+        question_file = paths.question_txt
         try:
             self._write_question_sheet_txt(question_file, document)
         except OSError:
-            question_file = output_path / f"exam_question_sheet_{timestamp}.txt"
+            question_file = fallback_paths.question_txt
             self._write_question_sheet_txt(question_file, document)
             self._warn("출력 파일명에 사용할 수 없는 문자가 있어 기본 파일명(exam)으로 저장했습니다.")
         generated = [str(question_file)]
 
         if document.file_type == "TYPE_A":
-            explanation_file = output_path / f"{safe_stem}_explanation_sheet_{timestamp}.txt"
+            explanation_file = paths.explanation_txt
             try:
                 self._write_explanation_sheet_txt(explanation_file, document)
             except OSError:
-                explanation_file = output_path / f"exam_explanation_sheet_{timestamp}.txt"
+                explanation_file = fallback_paths.explanation_txt
                 self._write_explanation_sheet_txt(explanation_file, document)
                 self._warn("해설 파일명에 사용할 수 없는 문자가 있어 기본 파일명(exam)으로 저장했습니다.")
             generated.append(str(explanation_file))
@@ -442,103 +555,95 @@ class OutputGenerator:
         return generated
 
     def _write_question_sheet_hwp(
-        self, path: Path, document: ExamDocument,
+        self, hwp, path: Path, document: ExamDocument,
         on_progress: ProgressCallback = None, has_explanation: bool = False,
-    ) -> bool:
-        hwp = None
-        success = False
-        try:
-            if on_progress:
-                self._set_progress(5, "문제지 HWP 열는 중...")
-            hwp = self._open_hwp_document(target_path=path)
-            self.formatter.setup_page(hwp)
-            self.formatter.setup_columns(hwp)
-            self._prime_body_start(hwp)
-
-            total = len(document.questions)
-            for i, question in enumerate(document.questions):
-                if on_progress and total > 0:
-                    if has_explanation:
-                        pct = 8 + int((i / total) * 42)  # 8% ~ 50%
-                    else:
-                        pct = 8 + int((i / total) * 82)  # 8% ~ 90%
-                    self._set_progress(pct, f"문제지 작성 중: {i + 1}/{total}")
-                self._insert_question_block(hwp, question)
-
-            # Skip global table walk here.
-            # Per-table treat-as-char is applied during insertion, and global
-            # control rewrites can destabilize anchors in some HWP builds.
-            save_pct = 52 if has_explanation else 92
-            if on_progress:
-                self._set_progress(save_pct, "문제지 저장 중...")
-            self._save_hwp(hwp, path)
-            success = True
-        except Exception as exc:
-            self._last_hwp_error = str(exc)
-        finally:
-            self._quit_hwp(hwp)
-        # COM 종료 후 바이너리 후처리로 style_id 설정
-        if success and self.formatter.use_styles:
+    ) -> None:
+        self.formatter.setup_page(hwp)
+        self.formatter.setup_columns(hwp)
+        self._prime_body_start(hwp)
+
+        total = len(document.questions)
+        for i, question in enumerate(document.questions):
+            if on_progress and total > 0:
+                if has_explanation:
+                    pct = 8 + int((i / total) * 42)  # 8% ~ 50%
+                else:
+                    pct = 8 + int((i / total) * 82)  # 8% ~ 90%
+                self._set_progress(pct, f"문제지 작성 중: {i + 1}/{total}")
+            self._insert_question_block(hwp, question)
+
+        # Skip global table walk here.
+        # Per-table treat-as-char is applied during insertion, and global
+        # control rewrites can destabilize anchors in some HWP builds.
+        save_pct = 52 if has_explanation else 92
+        if on_progress:
+            self._set_progress(save_pct, "문제지 저장 중...")
+        self._save_hwp(hwp, path)
+
+    def _write_explanation_sheet_hwp(
+        self, hwp, path: Path, document: ExamDocument,
+        on_progress: ProgressCallback = None,
+    ) -> None:
+        self.formatter.setup_page(hwp)
+        self.formatter.setup_columns(hwp)
+        self._prime_body_start(hwp)
+
+        total = len(document.questions)
+        for i, question in enumerate(document.questions):
+            if on_progress and total > 0:
+                pct = 58 + int((i / total) * 35)  # 58% ~ 93%
+                self._set_progress(pct, f"해설지 작성 중: {i + 1}/{total}")
+            self._insert_explanation_block(hwp, question)
+
+        if on_progress:
+            self._set_progress(95, "해설지 저장 중...")
+        self._save_hwp(hwp, path)
+
+    def _post_process_question_sheet(self, path: Path) -> None:
+        if self.formatter.use_styles:
             try:
                 ok = self.formatter.post_process_style_ids(path)
                 if not ok:
                     self._warn("문제지 스타일 후처리가 실패했습니다 (post_process_style_ids=False)")
             except Exception as exc:
                 self._warn(f"문제지 스타일 후처리 오류: {exc}")
-        if success:
-            try:
-                self.formatter.post_process_question_emphasis_faces(path)
-            except Exception as exc:
-                self._warn(f"문제지 강조폰트 후처리 오류: {exc}")
-        return success
-
-    def _write_explanation_sheet_hwp(
-        self, path: Path, document: ExamDocument,
-        on_progress: ProgressCallback = None,
-    ) -> bool:
-        hwp = None
-        success = False
         try:
-            if on_progress:
-                self._set_progress(55, "해설지 HWP 열는 중...")
-            hwp = self._open_hwp_document(target_path=path)
-            self.formatter.setup_page(hwp)
-            self.formatter.setup_columns(hwp)
-            self._prime_body_start(hwp)
-
-            total = len(document.questions)
-            for i, question in enumerate(document.questions):
-                if on_progress and total > 0:
-                    pct = 58 + int((i / total) * 35)  # 58% ~ 93%
-                    self._set_progress(pct, f"해설지 작성 중: {i + 1}/{total}")
-                self._insert_explanation_block(hwp, question)
+            self.formatter.post_process_question_emphasis_faces(path)
+        except Exception as exc:
+            self._warn(f"문제지 강조폰트 후처리 오류: {exc}")
 
-            if on_progress:
-                self._set_progress(95, "해설지 저장 중...")
-            self._save_hwp(hwp, path)
-            success = True
+    def _post_process_explanation_sheet(self, path: Path) -> None:
+        if not self.formatter.use_styles:
+            return
+        try:
+            ok = self.formatter.post_process_style_ids(path)
+            if not ok:
+                self._warn("해설지 스타일 후처리가 실패했습니다 (post_process_style_ids=False)")
         except Exception as exc:
-            self._last_hwp_error = str(exc)
-        finally:
-            self._quit_hwp(hwp)
-        # COM 종료 후 바이너리 후처리로 style_id 설정
-        if success and self.formatter.use_styles:
-            try:
-                ok = self.formatter.post_process_style_ids(path)
-                if not ok:
-                    self._warn("해설지 스타일 후처리가 실패했습니다 (post_process_style_ids=False)")
-            except Exception as exc:
-                self._warn(f"해설지 스타일 후처리 오류: {exc}")
-        return success
+            self._warn(f"해설지 스타일 후처리 오류: {exc}")
 
     def _open_hwp_document(self, target_path: Path | None = None):
         hwp = _ensure_clean_dispatch("HWPFrame.HwpObject")
         hwp.XHwpWindows.Item(0).Visible = False
-        module_registered = self._register_file_path_module(hwp)
+        self._module_registered = self._register_file_path_module(hwp)
         self._set_silent_message_boxes(hwp)
+        self._load_hwp_document(hwp, target_path)
+        return hwp
+
+    def _reopen_hwp_document(self, hwp, target_path: Path | None = None) -> None:
+        """이미 띄운 HWP 인스턴스에서 현재 문서를 닫고 다음 출력 문서를 연다."""
+        try:
+            hwp.Clear(1)
+        except Exception:
+            pass
+        self._load_hwp_document(hwp, target_path)
 
+    def _load_hwp_document(self, hwp, target_path: Path | None = None) -> None:
+        self._in_table_context = False
+        self._cached_sub_items_table_width_mm = None
+        self._cached_sub_items_table_width_hwp = None
         if self._resolved_template_path is not None:
-            if module_registered:
+            if self._module_registered:
                 # 템플릿을 출력 경로에 복사한 뒤 열기 (SaveAs 실패 방지)
                 open_path = self._resolved_template_path
                 if target_path is not None:
@@ -551,8 +656,9 @@ class OutputGenerator:
 
                 opened = self._open_template_document(hwp, open_path)
                 if opened:
-                    self._prepare_document_from_template(hwp)
-                    return hwp
+                    if not self._template_body_empty:
+                        self._prepare_document_from_template(hwp)
+                    return
 
                 if self._style_required and self._base_style_enabled:
                     raise RuntimeError(
@@ -580,7 +686,6 @@ class OutputGenerator:
             hwp.XHwpDocuments.Add(1)
         except Exception:
             pass
-        return hwp
 
     def _open_template_document(self, hwp, template_path: Path) -> bool:
         path_text = str(template_path)
@@ -591,16 +696,21 @@ class OutputGenerator:
 
     def _set_silent_message_boxes(self, hwp) -> None:
         # Prevent hidden-window modal prompts (path/security/version warnings).
-        try:
-            hwp.SetMessageBoxMode(0x000F0000)
-        except Exception:
-            return
+        self._set_message_box_mode(hwp, 0x000F0000)
 
     def _restore_message_boxes(self, hwp) -> None:
+        self._set_message_box_mode(hwp, 0x00000000)
+
+    def _set_message_box_mode(self, hwp, mode: int) -> None:
+        # COM 래퍼에는 임의 속성을 붙일 수 없어 id 기준으로 적용 모드를 기억한다.
+        key = id(hwp)
+        if self._message_box_modes.get(key) == mode:
+            return
         try:
-            hwp.SetMessageBoxMode(0x00000000)
+            hwp.SetMessageBoxMode(mode)
         except Exception:
             return
+        self._message_box_modes[key] = mode
 
     def _prepare_document_from_template(self, hwp) -> None:
         # Keep style definitions from template and clear only body text.
@@ -646,6 +756,19 @@ class OutputGenerator:
                 return
 
         def _try_filesaveas(action_name: str) -> bool:
+            if self._com_compat_mode:
+                return _try_filesaveas_compat(action_name)
+            try:
+                hwp.HAction.GetDefault(action_name, hwp.HParameterSet.HFileOpenSave.HSet)
+                hset = hwp.HParameterSet.HFileOpenSave.HSet
+                hset.SetItem("FileName", path_text)
+                hset.SetItem("Format", "HWP")
+                return bool(hwp.HAction.Execute(action_name, hset)) and _path_exists()
+            except Exception:
+                return False
+
+        def _try_filesaveas_compat(action_name: str) -> bool:
+            # 구버전 호환: 속성 대입과 SetItem을 모두 시도한다.
             try:
                 hwp.HAction.GetDefault(action_name, hwp.HParameterSet.HFileOpenSave.HSet)
                 fs = hwp.HParameterSet.HFileOpenSave
@@ -695,9 +818,13 @@ class OutputGenerator:
 
         raise RuntimeError("HWPFrame.HwpObject.SaveAs")
 
-    def _quit_hwp(self, hwp) -> None:
+    def _quit_hwp(self, hwp, background_wait: bool = False) -> Future | None:
+        """HWP를 종료한다.
+
+        background_wait=True면 프로세스 종료 확인을 워커에서 수행하고 그 Future를 반환한다.
+        """
         if hwp is None:
-            return
+            return None
         hwp_pid = self._get_hwp_pid(hwp)
         self._set_silent_message_boxes(hwp)
         try:
@@ -714,10 +841,16 @@ class OutputGenerator:
                 del hwp._oleobj_
         except Exception:
             pass
+        self._message_box_modes.pop(id(hwp), None)
+        self._release_com_handles(hwp)
         del hwp
         # HWP 프로세스가 실제로 종료되었는지 확인, 아니면 강제 종료
-        if hwp_pid is not None:
-            self._ensure_process_exited(hwp_pid)
+        if hwp_pid is None:
+            return None
+        if background_wait:
+            return _PROCESS_EXIT_EXECUTOR.submit(self._ensure_process_exited, hwp_pid)
+        self._ensure_process_exited(hwp_pid)
+        return None
 
     @staticmethod
     def _get_hwp_pid(hwp) -> int | None:
@@ -771,12 +904,43 @@ class OutputGenerator:
         except Exception:
             pass
 
+    def _get_com_handle(self, hwp, name: str, factory: Callable[[], Any]) -> Any:
+        """HAction/HParameterSet 등 반복 조회되는 COM 핸들을 인스턴스별로 캐시한다.
+
+        속성 접근마다 IDispatch 왕복이 생기므로 한 번 얻은 핸들을 재사용한다.
+        """
+        key = (id(hwp), name)
+        handle = self._com_handles.get(key)
+        if handle is None:
+            handle = factory()
+            self._com_handles[key] = handle
+        return handle
+
+    def _get_parameter_set(self, hwp, name: str) -> tuple[Any, Any]:
+        """hwp.HParameterSet.<name>과 그 HSet을 함께 반환한다."""
+        def _factory() -> tuple[Any, Any]:
+            pset = getattr(self._get_com_handle(hwp, "HParameterSet", lambda: hwp.HParameterSet), name)
+            return pset, pset.HSet
+
+        return self._get_com_handle(hwp, name, _factory)
+
+    def _release_com_handles(self, hwp) -> None:
+        key_id = id(hwp)
+        for key in [key for key in self._com_handles if key[0] == key_id]:
+            del self._com_handles[key]
+
     def _insert_text(self, hwp, text: str) -> None:
-        normalized = text.replace("\r\n", "\n").replace("\r", "\n").replace("\n", "\r\n")
+        if "\r" not in text:
+            # 대부분의 조각은 CR이 없으므로 LF만 한 번에 바꾼다.
+            normalized = text.replace("\n", "\r\n") if "\n" in text else text
+        else:
+            normalized = _EOL_RE.sub("\r\n", text)
         try:
-            hwp.HAction.GetDefault("InsertText", hwp.HParameterSet.HInsertText.HSet)
-            hwp.HParameterSet.HInsertText.Text = normalized
-            hwp.HAction.Execute("InsertText", hwp.HParameterSet.HInsertText.HSet)
+            haction = self._get_com_handle(hwp, "HAction", lambda: hwp.HAction)
+            pset, hset = self._get_parameter_set(hwp, "HInsertText")
+            haction.GetDefault("InsertText", hset)
+            pset.Text = normalized
+            haction.Execute("InsertText", hset)
             return
         except Exception:
             pass
@@ -786,28 +950,35 @@ class OutputGenerator:
         except Exception:
             return
 
+    def _insert_lines(self, hwp, lines: list[str]) -> None:
+        """같은 서식 구간의 줄들을 CRLF로 이어 한 번에 입력한다."""
+        if lines:
+            self._insert_text(hwp, "".join(f"{line}\r\n" for line in lines))
+
     def _insert_question_block(self, hwp, question: ExamQuestion) -> None:
-        self._heartbeat(f"문제 {question.number}: 시작")
+        self._heartbeat("문제 %s: 시작", question.number)
         # Guard against leaked table context from previous question.
         if not self._leave_table_context(hwp):
-            self._heartbeat(f"문제 {question.number}: 표 컨텍스트 정리 재시도")
+            self._heartbeat("문제 %s: 표 컨텍스트 정리 재시도", question.number)
             self._force_table_context_cleanup(hwp)
 
         number_prefix = f"{question.number}. "
         question_text = question.question_text or ""
+        buffer = _TextBuffer(self._insert_text)
 
-        self._heartbeat(f"문제 {question.number}: 문제 스타일")
+        self._heartbeat("문제 %s: 문제 스타일", question.number)
         self.formatter.apply_question_format(hwp, emphasize=False)
         # Ensure typed question text starts with question font even when the
         # paragraph begins after hidden control chars.
         self.formatter.apply_question_inline_char(hwp, emphasize=False)
-        self._heartbeat(f"문제 {question.number}: 문제 본문 입력")
-        self._insert_text(hwp, number_prefix)
-        self._insert_question_text_with_emphasis(hwp, question_text, question.negative_keyword)
-        self._insert_text(hwp, "\r\n")
+        self._heartbeat("문제 %s: 문제 본문 입력", question.number)
+        buffer.write(number_prefix)
+        self._insert_question_text_with_emphasis(hwp, question_text, question.negative_keyword, buffer)
+        buffer.write("\r\n")
 
         if question.sub_items:
-            self._heartbeat(f"문제 {question.number}: 소문항 블록")
+            buffer.flush(hwp)
+            self._heartbeat("문제 %s: 소문항 블록", question.number)
             self._insert_sub_items_block(
                 hwp,
                 question.sub_items,
@@ -817,11 +988,12 @@ class OutputGenerator:
             )
 
         if question.choices:
+            buffer.flush(hwp)
             render_choices_as_table = self._should_render_choices_as_table(question.choices)
             if question.sub_items and question.has_table:
                 render_choices_as_table = False
             if render_choices_as_table:
-                self._heartbeat(f"문제 {question.number}: 선지 표 블록")
+                self._heartbeat("문제 %s: 선지 표 블록", question.number)
                 choice_lines = [
                     self._strip_choice_noise_suffix(choice)
                     for choice in question.choices
@@ -837,13 +1009,15 @@ class OutputGenerator:
                 )
             else:
                 if not question.sub_items or self.formatter.choice_style != self.formatter.sub_items_style:
-                    self._heartbeat(f"문제 {question.number}: 선지 스타일")
+                    self._heartbeat("문제 %s: 선지 스타일", question.number)
                     self.formatter.apply_choice_format(hwp)
+                # 선지 줄과 문항 끝 줄바꿈은 같은 서식이라 한 번에 입력한다.
                 for choice_text in self._build_choice_lines(question.choices):
-                    self._insert_text(hwp, f"{choice_text}\r\n")
+                    buffer.write(f"{choice_text}\r\n")
 
-        self._insert_text(hwp, "\r\n")
-        self._heartbeat(f"문제 {question.number}: 완료")
+        buffer.write("\r\n")
+        buffer.flush(hwp)
+        self._heartbeat("문제 %s: 완료", question.number)
 
     def _insert_explanation_block(self, hwp, question: ExamQuestion) -> None:
         answer = question.answer or "-"
@@ -851,30 +1025,43 @@ class OutputGenerator:
         rendered_answer = answer_line if "정답" in answer_line else ""
         if not rendered_answer:
             rendered_answer = f"정답 {answer}"
+        buffer = _TextBuffer(self._insert_text)
 
         self.formatter.apply_question_format(hwp, emphasize=False)
-        self._insert_text(hwp, f"{question.number}. {rendered_answer}\r\n")
+        buffer.write(f"{question.number}. {rendered_answer}\r\n")
 
         if question.explanation:
+            buffer.flush(hwp)
             self.formatter.apply_explanation_format(hwp)
-            self._insert_text(hwp, f"{question.explanation}\r\n")
+            buffer.write(f"{question.explanation}\r\n")
+
+        buffer.write("\r\n")
+        buffer.flush(hwp)
 
-        self._insert_text(hwp, "\r\n")
+    def _insert_question_text_with_emphasis(
+        self, hwp, text: str, keyword: str, buffer: _TextBuffer | None = None,
+    ) -> None:
+        owns_buffer = buffer is None
+        if buffer is None:
+            buffer = _TextBuffer(self._insert_text)
 
-    def _insert_question_text_with_emphasis(self, hwp, text: str, keyword: str) -> None:
         if not keyword or keyword not in text:
-            self._insert_text(hwp, text)
-            return
+            buffer.write(text)
+        else:
+            before, matched, after = text.partition(keyword)
+            buffer.write(before)
+            buffer.flush(hwp)
 
-        before, matched, after = text.partition(keyword)
-        self._insert_text(hwp, before)
+            # Keep direct formatting only for negative-keyword emphasis.
+            self.formatter.apply_question_inline_char(hwp, emphasize=True)
+            buffer.write(matched)
+            buffer.flush(hwp)
 
-        # Keep direct formatting only for negative-keyword emphasis.
-        self.formatter.apply_question_inline_char(hwp, emphasize=True)
-        self._insert_text(hwp, matched)
+            self.formatter.apply_question_inline_char(hwp, emphasize=False)
+            buffer.write(after)
 
-        self.formatter.apply_question_inline_char(hwp, emphasize=False)
-        self._insert_text(hwp, after)
+        if owns_buffer:
+            buffer.flush(hwp)
 
     def _insert_sub_items_block(
         self,
@@ -905,10 +1092,9 @@ class OutputGenerator:
 
         if not self._should_use_sub_items_table(sub_items, prefer_table=prefer_table):
             if question_number is not None and self._use_sub_items_table and len(sub_items) >= 2:
-                self._heartbeat(f"문제 {question_number}: 소문항 표 생략(길이/복잡도)")
+                self._heartbeat("문제 %s: 소문항 표 생략(길이/복잡도)", question_number)
             apply_line_style(hwp)
-            for item in sub_items:
-                self._insert_text(hwp, f"{item}\r\n")
+            self._insert_lines(hwp, sub_items)
             return
 
         try:
@@ -935,12 +1121,11 @@ class OutputGenerator:
                 self._insert_text(hwp, "\r\n")
             self._heartbeat("소문항: 완료")
         except Exception as exc:
-            self._heartbeat(f"소문항: 표 실패({type(exc).__name__}), 일반 입력 대체")
+            self._heartbeat("소문항: 표 실패(%s), 일반 입력 대체", type(exc).__name__)
             self._leave_table_context(hwp)
             self._force_table_context_cleanup(hwp)
             apply_line_style(hwp)
-            for item in sub_items:
-                self._insert_text(hwp, f"{item}\r\n")
+            self._insert_lines(hwp, sub_items)
 
     def _insert_sub_items_lines_in_table(
         self,
@@ -1000,48 +1185,37 @@ class OutputGenerator:
             return ""
         if "\t" in text:
             return self._strip_choice_noise_suffix(text)
-        marker_pattern = re.compile(r"[①②③④⑤]")
-        matches = list(marker_pattern.finditer(text))
-        if len(matches) < 2:
+        positions = [index for index, ch in enumerate(text) if ch in _CHOICE_MARKERS]
+        if len(positions) < 2:
             return self._strip_choice_noise_suffix(text)
 
+        positions.append(len(text))
         parts: list[str] = []
-        for index, match in enumerate(matches):
-            start = match.start()
-            end = matches[index + 1].start() if index + 1 < len(matches) else len(text)
+        for start, end in zip(positions, positions[1:]):
             part = text[start:end].strip()
             if not part:
                 continue
-            part = re.sub(r"\s+", " ", part)
-            part = self._strip_choice_noise_suffix(part)
-            parts.append(part)
+            # 이미 공백을 정리했으므로 노이즈 접미만 확인한다.
+            parts.append(self._drop_choice_noise_suffix(_WHITESPACE_RE.sub(" ", part)))
         if len(parts) < 2:
             return self._strip_choice_noise_suffix(text)
-        return (" " * 9).join(parts)
+        return _CHOICE_SEP.join(parts)
 
     @staticmethod
     def _strip_choice_noise_suffix(text: str) -> str:
         raw = (text or "").strip()
         if "\t" in raw:
-            chunks = [re.sub(r"[ ]+", " ", chunk).strip() for chunk in raw.split("\t")]
+            chunks = [_SPACE_RUN_RE.sub(" ", chunk).strip() for chunk in raw.split("\t")]
             normalized = "\t".join(chunks)
         else:
-            normalized = re.sub(r"\s+", " ", raw)
-        if not normalized:
-            return ""
+            normalized = _WHITESPACE_RE.sub(" ", raw)
+        return OutputGenerator._drop_choice_noise_suffix(normalized)
 
+    @staticmethod
+    def _drop_choice_noise_suffix(normalized: str) -> str:
         # OLE 추출 노이즈가 선지 끝에 1글자로 끼는 케이스를 제거한다.
-        # 예: U+3C72, U+2C86, U+4546
-        def _is_noise_char(ch: str) -> bool:
-            code = ord(ch)
-            return (
-                0x0370 <= code <= 0x03FF  # Greek
-                or 0x2C80 <= code <= 0x2CFF  # Coptic
-                or 0x3400 <= code <= 0x4DBF  # CJK Extension A
-            )
-
-        if normalized and _is_noise_char(normalized[-1]):
-            normalized = normalized[:-1].rstrip()
+        if normalized and ord(normalized[-1]) in _CHOICE_NOISE_CODEPOINTS:
+            return normalized[:-1].rstrip()
         return normalized
 
     def _build_choice_lines(self, choices: list[str]) -> list[str]:
@@ -1050,42 +1224,38 @@ class OutputGenerator:
             for choice in choices
             if (choice or "").strip()
         ]
-        if self._can_compact_choice_lines(lines):
-            normalized = [re.sub(r"\s+", " ", line.strip()) for line in lines]
-            return [(" " * 9).join(normalized)]
+        compacted = self._compact_choice_lines(lines)
+        if compacted is not None:
+            return [compacted]
         return lines
 
     @staticmethod
-    def _can_compact_choice_lines(lines: list[str]) -> bool:
+    def _compact_choice_lines(lines: list[str]) -> str | None:
+        """짧은 선지들을 9칸 간격 한 줄로 합친다. 합칠 수 없으면 None을 반환한다."""
         if len(lines) < 2:
-            return False
-        marker_line = re.compile(r"^[①②③④⑤]\s*")
-        marker_any = re.compile(r"[①②③④⑤]")
+            return None
 
         normalized: list[str] = []
-        payload_lengths: list[int] = []
+        total = (len(lines) - 1) * 9
         for line in lines:
             if "\t" in line:
-                return False
-            text = re.sub(r"\s+", " ", (line or "").strip())
+                return None
+            text = _WHITESPACE_RE.sub(" ", (line or "").strip())
             if not text:
-                return False
-            if len(marker_any.findall(text)) != 1:
-                return False
-            if not marker_line.match(text):
-                return False
-            body = marker_line.sub("", text, count=1).strip()
-            if not body:
-                return False
+                return None
+            marker = _CHOICE_MARKER_LINE_RE.match(text)
+            if not marker:
+                return None
+            if _CHOICE_MARKER_ANY_RE.search(text, marker.end()):
+                return None
+            body = text[marker.end():].strip()
+            if not body or len(body) > 20:
+                return None
+            total += len(text)
+            if total > 110:
+                return None
             normalized.append(text)
-            payload_lengths.append(len(body))
-
-        if not payload_lengths:
-            return False
-        if max(payload_lengths) > 20:
-            return False
-        total = sum(len(text) for text in normalized) + (len(normalized) - 1) * 9
-        return total <= 110
+        return _CHOICE_SEP.join(normalized)
 
     def _should_render_choices_as_table(self, choices: list[str]) -> bool:
         if not self._use_sub_items_table:
@@ -1120,66 +1290,46 @@ class OutputGenerator:
         if len(sub_items) < 2:
             return False
 
-        lengths = [len((line or "").strip()) for line in sub_items]
-        if not lengths:
-            return False
-
-        total_len = sum(lengths)
-        max_len = max(lengths)
         # Very long sub-item blocks tend to destabilize table anchoring in HWP COM.
-        if total_len > 380:
-            return False
-        if max_len > 145:
-            return False
+        total_len = 0
+        for line in sub_items:
+            line_len = len(line.strip()) if line else 0
+            total_len += line_len
+            if total_len > 380 or line_len > 145:
+                return False
         return True
 
     def _create_single_cell_sub_items_table(self, hwp) -> bool:
         """소문항 박스용 1x1 표를 생성한다. 실패 시 한 번 더 재시도한다."""
         for attempt in range(2):
-            # CloseEx/Cancel은 비표 컨텍스트에서도 무해해서 선제적으로 정리한다.
-            for _ in range(2):
-                try:
-                    hwp.HAction.Run("CloseEx")
-                except Exception:
-                    pass
-                try:
-                    hwp.HAction.Run("Cancel")
-                except Exception:
-                    pass
-            # Selection/caret cleanup before TableCreate.
-            # Keep the caret at current question position; forcing MoveDocEnd
-            # can make table anchors drift toward later paragraphs.
-            for action_name in ("Cancel",):
-                try:
-                    hwp.HAction.Run(action_name)
-                except Exception:
-                    pass
-
             try:
-                if self._execute_table_create(hwp, use_custom_size=False):
-                    return True
-                if self._execute_table_create(hwp, use_custom_size=True):
+                if self._execute_table_create(hwp, use_custom_size=False) or self._execute_table_create(
+                    hwp, use_custom_size=True
+                ):
+                    self._in_table_context = True
                     return True
             except Exception as exc:
-                self._heartbeat(f"소문항: 표 생성 예외({type(exc).__name__})")
+                self._heartbeat("소문항: 표 생성 예외(%s)", type(exc).__name__)
 
             if attempt == 0:
                 self._heartbeat("소문항: 표 생성 재시도")
+                # 첫 시도가 실패했을 때만 남은 표/선택 상태를 정리한다.
+                # Keep the caret at current question position; forcing MoveDocEnd
+                # can make table anchors drift toward later paragraphs.
+                self._force_table_context_cleanup(hwp, rounds=2)
                 self._advance_to_fresh_region_for_table(hwp)
-                for action_name in ("Cancel",):
-                    try:
-                        hwp.HAction.Run(action_name)
-                    except Exception:
-                        pass
+                try:
+                    hwp.HAction.Run("Cancel")
+                except Exception:
+                    pass
         return False
 
     def _execute_table_create(self, hwp, use_custom_size: bool) -> bool:
-        width_hwp = int(hwp.MiliToHwpUnit(self._get_sub_items_table_width_mm()))
-
         # Use legacy HParameterSet route only.
         # TreatAsChar is controlled by HTableCreation.TableProperties.
-        hwp.HAction.GetDefault("TableCreate", hwp.HParameterSet.HTableCreation.HSet)
-        table = hwp.HParameterSet.HTableCreation
+        haction = self._get_com_handle(hwp, "HAction", lambda: hwp.HAction)
+        table, table_hset = self._get_parameter_set(hwp, "HTableCreation")
+        haction.GetDefault("TableCreate", table_hset)
         table.Rows = 1
         table.Cols = 1
         try:
@@ -1200,11 +1350,15 @@ class OutputGenerator:
         except Exception:
             pass
         if use_custom_size:
+            width_hwp = self._cached_sub_items_table_width_hwp
+            if width_hwp is None:
+                width_hwp = int(hwp.MiliToHwpUnit(self._get_sub_items_table_width_mm()))
+                self._cached_sub_items_table_width_hwp = width_hwp
             table.WidthType = 2
             table.HeightType = 0
             table.WidthValue = width_hwp
             table.HeightValue = hwp.MiliToHwpUnit(0.0)
-        return bool(hwp.HAction.Execute("TableCreate", table.HSet))
+        return bool(haction.Execute("TableCreate", table_hset))
 
     def _set_current_table_treat_as_char(self, hwp) -> bool:
         """현재 표를 '글자처럼 취급'으로 강제 설정한다."""
@@ -1212,8 +1366,12 @@ class OutputGenerator:
 
         # Conservative action path first.
         try:
-            action = hwp.CreateAction("TablePropertyDialog")
-            action_set = action.CreateSet()
+            # 액션 객체와 파라미터 셋은 재사용하고 GetDefault로 매번 현재 표 값을 다시 읽는다.
+            def _create_action() -> tuple[Any, Any]:
+                created = hwp.CreateAction("TablePropertyDialog")
+                return created, created.CreateSet()
+
+            action, action_set = self._get_com_handle(hwp, "Action:TablePropertyDialog", _create_action)
             action.GetDefault(action_set)
             action_set.SetItem("TreatAsChar", 1)
             action.Execute(action_set)
@@ -1223,32 +1381,22 @@ class OutputGenerator:
 
         # Legacy fallback.
         try:
-            hwp.HAction.GetDefault("TablePropertyDialog", hwp.HParameterSet.HShapeObject.HSet)
-            shape = hwp.HParameterSet.HShapeObject
+            haction = self._get_com_handle(hwp, "HAction", lambda: hwp.HAction)
+            shape, shape_hset = self._get_parameter_set(hwp, "HShapeObject")
+            haction.GetDefault("TablePropertyDialog", shape_hset)
             setattr(shape, "TreatAsChar", 1)
-            if hwp.HAction.Execute("TablePropertyDialog", hwp.HParameterSet.HShapeObject.HSet):
+            if haction.Execute("TablePropertyDialog", shape_hset):
                 applied = True
         except Exception:
             pass
 
-        # Direct property fallback (TreatAsChar only).
-        matched_ctrl = False
-        for ctrl in self._iter_current_table_controls(hwp):
-            matched_ctrl = True
-            if self._set_control_treat_as_char_only(ctrl):
-                applied = True
-
-        # Verify on currently bound table controls when discoverable.
-        verified = False
-        for ctrl in self._iter_current_table_controls(hwp):
-            matched_ctrl = True
-            if self._control_property_is_true(ctrl, "TreatAsChar"):
-                verified = True
-                break
-
-        if matched_ctrl:
-            return verified
-        return applied
+        # Direct property fallback (TreatAsChar only), then verify on the
+        # same control so the ParentCtrl chain is walked only once.
+        ctrl = self._find_current_table_control(hwp)
+        if ctrl is None:
+            return applied
+        self._set_control_treat_as_char_only(ctrl)
+        return self._control_property_is_true(ctrl, "TreatAsChar")
 
     def _set_control_treat_as_char_only(self, ctrl) -> bool:
         try:
@@ -1306,6 +1454,10 @@ class OutputGenerator:
                 except Exception:
                     break
 
+    def _find_current_table_control(self, hwp):
+        """커서 위치에서 가장 가까운 표 컨트롤 하나를 반환한다. 없으면 None."""
+        return next(self._iter_current_table_controls(hwp), None)
+
     def _apply_table_control_properties(self, hwp, ctrl) -> bool:
         # Preferred: update current properties in-place to avoid resetting
         # unrelated anchor/wrapping fields.
@@ -1400,8 +1552,10 @@ class OutputGenerator:
         return None
 
     def _is_current_table_layout_suspicious(self, hwp) -> bool:
-        min_width = int(hwp.MiliToHwpUnit(45.0))
+        min_width = None
         for ctrl in self._iter_current_table_controls(hwp):
+            if min_width is None:
+                min_width = int(hwp.MiliToHwpUnit(45.0))
             width = self._read_table_control_property(ctrl, "Width")
             try:
                 width_val = int(width)
@@ -1420,6 +1574,8 @@ class OutputGenerator:
 
     def _get_sub_items_table_width_mm(self) -> float:
         """현재 페이지/단 설정을 고려한 소문항 표 너비(mm)를 계산한다."""
+        if self._cached_sub_items_table_width_mm is not None:
+            return self._cached_sub_items_table_width_mm
         page_width = 210.0  # A4 portrait
         left_margin = float(self.formatter.page_config.get("left_margin", 15.0))
         right_margin = float(self.formatter.page_config.get("right_margin", 15.0))
@@ -1430,7 +1586,8 @@ class OutputGenerator:
         per_column_width = usable_width / columns if columns > 0 else usable_width
         # Keep a safety margin for indentation and HWP internal fitting.
         safe_width = per_column_width - 6.0
-        return max(50.0, min(82.0, safe_width))
+        self._cached_sub_items_table_width_mm = max(50.0, min(82.0, safe_width))
+        return self._cached_sub_items_table_width_mm
 
     def _advance_to_fresh_region_for_table(self, hwp) -> None:
         """표 생성 실패 시 커서를 같은 문제 영역에서 가볍게 재정렬한다."""
@@ -1457,33 +1614,25 @@ class OutputGenerator:
             return False
 
     def _leave_table_context(self, hwp) -> bool:
-        # Unconditionally try CloseEx/Cancel first.
-        # Table-context probing is not always reliable in COM automation.
-        for _ in range(8):
-            try:
-                hwp.HAction.Run("CloseEx")
-            except Exception:
-                pass
-            try:
-                hwp.HAction.Run("Cancel")
-            except Exception:
-                pass
-        for _ in range(4):
+        # 이번 문서에서 만든 표 안에 있지 않으면 COM 호출 없이 통과한다.
+        if not self._in_table_context:
+            return True
+        # Table-context probing is not always reliable in COM automation,
+        # so issue one CloseEx/Cancel round before probing.
+        self._force_table_context_cleanup(hwp, rounds=1)
+        for _ in range(_TABLE_LEAVE_MAX_ROUNDS):
             if not self._is_in_table_context(hwp):
+                self._in_table_context = False
                 return True
-            try:
-                hwp.HAction.Run("CloseEx")
-            except Exception:
-                pass
-            try:
-                hwp.HAction.Run("Cancel")
-            except Exception:
-                pass
-        return not self._is_in_table_context(hwp)
+            self._force_table_context_cleanup(hwp, rounds=1)
+        if self._is_in_table_context(hwp):
+            return False
+        self._in_table_context = False
+        return True
 
-    def _force_table_context_cleanup(self, hwp) -> None:
+    def _force_table_context_cleanup(self, hwp, rounds: int = 4) -> None:
         # Fallback cleanup used when context probing is unreliable.
-        for _ in range(4):
+        for _ in range(rounds):
             try:
                 hwp.HAction.Run("CloseEx")
             except Exception:
@@ -1497,24 +1646,36 @@ class OutputGenerator:
         # After leaving table edit mode, some builds keep the caret before the
         # table object. Move to paragraph end so subsequent text is inserted
         # after the table, not before it.
-        for action_name in ("MoveParaEnd", "MoveRight"):
+        haction = self._get_com_handle(hwp, "HAction", lambda: hwp.HAction)
+        try:
+            haction.Run("MoveParaEnd")
+        except Exception:
+            pass
+        else:
             try:
-                hwp.HAction.Run(action_name)
+                haction.Run("Cancel")
             except Exception:
-                continue
+                pass
+        try:
+            haction.Run("MoveRight")
+        except Exception:
+            pass
+        else:
             try:
-                hwp.HAction.Run("Cancel")
+                haction.Run("Cancel")
             except Exception:
                 pass
 
     def _apply_table_box_border(self, hwp) -> None:
         try:
-            hwp.HAction.Run("TableCellBlock")
-            hwp.HAction.Run("TableCellBlockExtend")
-            hwp.HAction.GetDefault("CellBorderFill", hwp.HParameterSet.HCellBorderFill.HSet)
-            cb = hwp.HParameterSet.HCellBorderFill
-            line_type = hwp.HwpLineType("Solid")
-            line_width = hwp.HwpLineWidth("0.12mm")
+            haction = self._get_com_handle(hwp, "HAction", lambda: hwp.HAction)
+            haction.Run("TableCellBlock")
+            haction.Run("TableCellBlockExtend")
+            cb, cb_hset = self._get_parameter_set(hwp, "HCellBorderFill")
+            haction.GetDefault("CellBorderFill", cb_hset)
+            # 선 종류/굵기 상수는 인스턴스 동안 바뀌지 않으므로 한 번만 조회한다.
+            line_type = self._get_com_handle(hwp, "HwpLineType:Solid", lambda: hwp.HwpLineType("Solid"))
+            line_width = self._get_com_handle(hwp, "HwpLineWidth:0.12mm", lambda: hwp.HwpLineWidth("0.12mm"))
 
             cb.ApplyTo = 0
             cb.AllCellsBorderFill = 1
@@ -1530,8 +1691,8 @@ class OutputGenerator:
             cb.BorderColorBottom = 0
             cb.BorderColorLeft = 0
             cb.BorderColorRight = 0
-            hwp.HAction.Execute("CellBorderFill", cb.HSet)
-            hwp.HAction.Run("Cancel")
+            haction.Execute("CellBorderFill", cb_hset)
+            haction.Run("Cancel")
         except Exception:
             return
 
@@ -1539,10 +1700,8 @@ class OutputGenerator:
         self.formatter.apply_sub_items_format(hwp)
         border_top = "┌" + ("─" * 66) + "┐"
         border_bottom = "└" + ("─" * 66) + "┘"
-        self._insert_text(hwp, f"{border_top}\r\n")
-        for item in sub_items:
-            self._insert_text(hwp, f"│ {item}\r\n")
-        self._insert_text(hwp, f"{border_bottom}\r\n")
+        body = "".join(f"│ {item}\r\n" for item in sub_items)
+        self._insert_text(hwp, f"{border_top}\r\n{body}{border_bottom}\r\n")
 
     def _normalize_all_tables_treat_as_char(self, hwp, quiet: bool = False) -> None:
         """문서 내 모든 표를 글자처럼 취급으로 보정해 위치 밀림을 줄인다."""
@@ -1567,38 +1726,31 @@ class OutputGenerator:
                 break
 
         if normalized > 0 and not quiet:
-            self._heartbeat(f"표 글자처럼 보정: {normalized}개")
+            self._heartbeat("표 글자처럼 보정: %s개", normalized)
 
     def _write_question_sheet_txt(self, path: Path, document: ExamDocument) -> None:
-        with path.open("w", encoding="utf-8") as file:
-            file.write("[문제지]\n")
-            file.write(f"유형: {document.file_type}\n")
-            file.write(f"문항 수: {document.total_count}\n")
-            file.write("\n")
-            for question in document.questions:
-                file.write(self._render_question(question))
-                file.write("\n")
+        parts = ["[문제지]\n", f"유형: {document.file_type}\n", f"문항 수: {document.total_count}\n", "\n"]
+        for question in document.questions:
+            parts.append(self._render_question(question))
+            parts.append("\n")
+        path.write_text("".join(parts), encoding="utf-8")
 
     def _write_explanation_sheet_txt(self, path: Path, document: ExamDocument) -> None:
-        with path.open("w", encoding="utf-8") as file:
-            file.write("[해설지]\n")
-            file.write(f"유형: {document.file_type}\n")
-            file.write(f"문항 수: {document.total_count}\n")
-            file.write("\n")
-            for question in document.questions:
-                answer = question.answer or "-"
-                answer_line = (question.answer_line or "").strip()
-                rendered_answer = answer_line if "정답" in answer_line else ""
-                if not rendered_answer:
-                    rendered_answer = f"정답 {answer}"
-                explanation = question.explanation or ""
-                file.write(f"{question.number:02d}. {rendered_answer}\n")
-                if explanation:
-                    file.write(f"{explanation}\n")
-                file.write("\n")
+        parts = ["[해설지]\n", f"유형: {document.file_type}\n", f"문항 수: {document.total_count}\n", "\n"]
+        for question in document.questions:
+            answer = question.answer or "-"
+            answer_line = (question.answer_line or "").strip()
+            rendered_answer = answer_line if "정답" in answer_line else ""
+            if not rendered_answer:
+                rendered_answer = f"정답 {answer}"
+            explanation = question.explanation or ""
+            parts.append(f"{question.number:02d}. {rendered_answer}\n")
+            if explanation:
+                parts.append(f"{explanation}\n")
+            parts.append("\n")
+        path.write_text("".join(parts), encoding="utf-8")
 
     def _render_question(self, question: ExamQuestion) -> str:
-        lines = [f"{question.number:02d}. {question.question_text}".rstrip()]
-        lines.extend(question.sub_items)
-        lines.extend(question.choices)
-        return "\n".join(lines).strip() + "\n"
+        # 첫 줄은 항상 문항 번호로 시작하므로 앞쪽 공백 제거는 필요 없다.
+        lines = [f"{question.number:02d}. {question.question_text}".rstrip(), *question.sub_items, *question.choices]
+        return "\n".join(lines).rstrip() + "\n"
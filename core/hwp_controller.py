@@ -4,7 +4,9 @@ import os
 import re
 import struct
 import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator
 
 from .com_utils import ensure_clean_dispatch as _ensure_clean_dispatch
 from .exceptions import HwpNotAvailableError, UnsupportedFileError
@@ -21,6 +23,92 @@ except ImportError:  # pragma: no cover - depends on local environment
 
 
 TAG_PARA_TEXT = 67
+# 레코드 헤더/FileHeader 속성 모두 little-endian uint32
+_U32 = struct.Struct("<I")
+_HWP_FLAG_COMPRESSED = 0x01
+_HWP_FLAG_ENCRYPTED = 0x02
+_UTF16_LINE_BREAK = "\n".encode("utf-16le")
+# BodyText 섹션 압축 해제 시 초기 출력 버퍼 배수
+_DECOMPRESS_SIZE_RATIO = 4
+# 여러 섹션을 병렬로 압축 해제할 때의 최대 스레드 수
+_SECTION_WORKERS = 4
+
+# NUL 제거, 제어문자(탭/LF 제외)→공백, 가운뎃점 통일, OLE 디코딩 노이즈 제거를 한 번에 처리한다.
+_CLEAN_TRANSLATE_TABLE: dict[int, str | None] = {
+    0x00: None,
+    **dict.fromkeys(range(0x01, 0x09), " "),
+    **dict.fromkeys(range(0x0B, 0x20), " "),
+    ord("⋅"): "·",
+    ord("･"): "·",
+    **dict.fromkeys(range(0x0100, 0x0250)),
+    **dict.fromkeys(range(0x0300, 0x0370)),
+    **dict.fromkeys(range(0x0400, 0x0530)),
+    **dict.fromkeys(range(0x0590, 0x0600)),
+    **dict.fromkeys(range(0xFFF0, 0x10000)),
+}
+
+# _clean_line은 줄마다 호출되므로 패턴을 미리 컴파일해 둔다.
+_WHITESPACE_RE = re.compile(r"\s+")
+# 사례문 인물 라벨(甲/乙 …)과 그 뒤에 붙는 조사
+_HANJA_LABELS = frozenset("甲乙丙丁戊己庚辛壬癸")
+_HANJA_LABEL_JOSA = frozenset("은는이가을를의")
+# 선행 노이즈 제거가 멈추는 문자. 하나도 없으면 줄 전체가 노이즈다.
+_LEADING_KEEP_RE = re.compile(r"[0-9A-Za-z가-힣①②③④⑤㉠㉡㉢㉣㉤㉥★<\[\(]")
+# 위 패턴에서 한글 음절 범위를 뺀 문자 집합 (첫 글자 빠른 판정용)
+_LEADING_KEEP_CHARS = frozenset(
+    "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz①②③④⑤㉠㉡㉢㉣㉤㉥★<[("
+)
+_CONTENT_CHAR_RE = re.compile(r"[0-9A-Za-z가-힣①②③④⑤]")
+_PUNCT_ONLY_CHARS = frozenset("-.=·•▪▫◦※*")
+
+
+def _decompress_section(stream_data: bytes) -> bytes:
+    # 본문 섹션은 보통 수 배로 풀리므로 출력 버퍼를 미리 잡아 재할당을 줄인다.
+    return zlib.decompress(stream_data, -15, max(zlib.DEF_BUF_SIZE, len(stream_data) * _DECOMPRESS_SIZE_RATIO))
+
+
+def _iter_para_text_lines(stream_data: bytes) -> Iterator[str]:
+    """압축이 풀린 섹션 레코드를 훑으며 PARA_TEXT의 비어 있지 않은 줄을 내보낸다.
+
+    인스턴스 상태를 쓰지 않는 정수 루프라 모듈 함수로 분리해 둔다.
+    """
+    index: int = 0
+    length: int = len(stream_data)
+    payloads: list[bytes] = []
+    # 레코드 수만큼 도는 루프라 바운드 메서드를 지역 변수로 잡아 둔다.
+    unpack_from = _U32.unpack_from
+    while index + 4 <= length:
+        (header,) = unpack_from(stream_data, index)
+        index += 4
+
+        tag_id = header & 0x3FF
+        size = (header >> 20) & 0xFFF
+        if size == 0xFFF:
+            if index + 4 > length:
+                break
+            (size,) = unpack_from(stream_data, index)
+            index += 4
+
+        end = index + size
+        if end > length:
+            break
+
+        # 대부분의 레코드는 PARA_TEXT가 아니므로 payload를 잘라내지 않고 건너뛴다.
+        if tag_id != TAG_PARA_TEXT or not size:
+            index = end
+            continue
+
+        # 홀수 길이의 끝 바이트는 레코드별 디코딩에서도 버려졌으므로 미리 잘라
+        # 이어 붙였을 때 다음 레코드의 UTF-16 정렬이 밀리지 않게 한다.
+        payloads.append(stream_data[index:end - (size & 1)])
+        index = end
+
+    # 레코드마다 코덱을 부르지 않고 줄바꿈으로 이어 섹션당 한 번만 디코딩한다.
+    text = _UTF16_LINE_BREAK.join(payloads).decode("utf-16le", errors="ignore")
+    # isspace()는 strip()과 달리 사본을 만들지 않고 공백 줄을 거른다.
+    for line in text.splitlines():
+        if line and not line.isspace():
+            yield line
 
 
 class HwpController:
@@ -34,8 +122,13 @@ class HwpController:
         return self._extract_from_hwp(path)
 
     def _read_text_file(self, path: Path) -> list[str]:
-        with path.open("r", encoding="utf-8") as file:
-            return [line.rstrip("\n") for line in file]
+        # 한 번에 읽어 나눈다. splitlines()는 \x0b, \x1c 등에서도 끊어 버리므로
+        # 줄 단위 순회와 같게 "\n"(개행 변환 후)으로만 나누고 마지막 빈 조각을 뺀다.
+        text = path.read_text(encoding="utf-8")
+        lines = text.split("\n")
+        if lines[-1] == "":
+            lines.pop()
+        return lines
 
     def _extract_from_hwp(self, path: Path) -> list[str]:
         ole_error: Exception | None = None
@@ -70,127 +163,88 @@ class HwpController:
             if not ole.exists("FileHeader"):
                 raise HwpNotAvailableError("HWP FileHeader 스트림이 없습니다.")
 
-            if self._is_hwp_encrypted(ole):
+            # 서명(32) + 버전(4) + 속성(4)까지만 필요하다.
+            flags = self._parse_hwp_flags(ole.openstream("FileHeader").read(40))
+            if flags & _HWP_FLAG_ENCRYPTED:
                 raise HwpNotAvailableError("파일이 암호로 보호되어 있습니다.")
 
-            compressed = self._is_hwp_compressed(ole)
+            compressed = bool(flags & _HWP_FLAG_COMPRESSED)
             sections = self._list_body_sections(ole)
             if not sections:
                 raise HwpNotAvailableError("BodyText 섹션을 찾지 못했습니다.")
 
-            lines: list[str] = []
-            for section in sections:
-                data = ole.openstream(section).read()
-                lines.extend(self._extract_para_text_lines(data, compressed))
+            # olefile 스트림 읽기는 스레드 안전하지 않으므로 순서대로 읽어 둔다.
+            section_data = [ole.openstream(section).read() for section in sections]
 
-            cleaned = [line for line in (self._clean_line(line) for line in lines) if line]
-            if not cleaned:
-                raise HwpNotAvailableError("BodyText에서 추출된 텍스트가 없습니다.")
-            return cleaned
+        if compressed:
+            section_data = self._decompress_sections(section_data)
+        lines: list[str] = []
+        for data in section_data:
+            lines.extend(_iter_para_text_lines(data))
 
-    def _is_hwp_encrypted(self, ole: "olefile.OleFileIO") -> bool:
-        header = ole.openstream("FileHeader").read()
-        if len(header) < 40:
-            return False
-        flags = struct.unpack("<I", header[36:40])[0]
-        return bool(flags & 0x02)
+        cleaned = list(filter(None, map(self._clean_line, lines)))
+        if not cleaned:
+            raise HwpNotAvailableError("BodyText에서 추출된 텍스트가 없습니다.")
+        return cleaned
 
-    def _is_hwp_compressed(self, ole: "olefile.OleFileIO") -> bool:
-        header = ole.openstream("FileHeader").read()
+    @staticmethod
+    def _parse_hwp_flags(header: bytes) -> int:
+        """FileHeader 바이트에서 속성 플래그(offset 36)를 읽는다. 짧으면 0."""
         if len(header) < 40:
-            return False
-        flags = struct.unpack("<I", header[36:40])[0]
-        return bool(flags & 0x01)
+            return 0
+        return _U32.unpack_from(header, 36)[0]
 
     def _list_body_sections(self, ole: "olefile.OleFileIO") -> list[str]:
         sections: list[tuple[int, list[str]]] = []
         for entry in ole.listdir(streams=True, storages=False):
             if len(entry) >= 2 and entry[0] == "BodyText" and entry[1].startswith("Section"):
                 try:
-                    index = int(entry[1].replace("Section", ""))
+                    index = int(entry[1][len("Section"):])
                 except ValueError:
                     index = 0
                 sections.append((index, entry))
         sections.sort(key=lambda item: item[0])
         return ["/".join(entry) for _, entry in sections]
 
-    def _extract_para_text_lines(self, stream_data: bytes, compressed: bool) -> list[str]:
-        if compressed:
-            stream_data = zlib.decompress(stream_data, -15)
-
-        output: list[str] = []
-        index = 0
-        length = len(stream_data)
-        while index + 4 <= length:
-            header = struct.unpack("<I", stream_data[index:index + 4])[0]
-            index += 4
-
-            tag_id = header & 0x3FF
-            size = (header >> 20) & 0xFFF
-            if size == 0xFFF:
-                if index + 4 > length:
-                    break
-                size = struct.unpack("<I", stream_data[index:index + 4])[0]
-                index += 4
-
-            if index + size > length:
-                break
-
-            payload = stream_data[index:index + size]
-            index += size
-
-            if tag_id != TAG_PARA_TEXT or not payload:
-                continue
+    def _decompress_sections(self, section_data: list[bytes]) -> list[bytes]:
+        """BodyText 섹션들을 압축 해제한다. zlib은 GIL을 놓으므로 여러 섹션은 병렬로 푼다."""
+        if len(section_data) < 2:
+            return [_decompress_section(data) for data in section_data]
+        with ThreadPoolExecutor(max_workers=min(_SECTION_WORKERS, len(section_data))) as executor:
+            return list(executor.map(_decompress_section, section_data))
 
-            text = payload.decode("utf-16le", errors="ignore")
-            for line in text.splitlines():
-                if line.strip():
-                    output.append(line)
-        return output
-
-    def _clean_line(self, line: str) -> str:
-        text = line.replace("\x00", "")
+    @staticmethod
+    def _clean_line(line: str) -> str:
         # Keep tab separators so table-like rows are not flattened.
-        text = re.sub(r"[\u0001-\u0008\u000B-\u001F]", " ", text)
-        text = text.replace("⋅", "·")
-        text = text.replace("･", "·")
-
-        # OLE 디코딩 과정에서 섞이는 비정상 문자 제거
-        text = re.sub(r"[\u0100-\u024F\u0300-\u036F\u0400-\u052F\u0590-\u05FF]", "", text)
-        text = re.sub(r"[\uFFF0-\uFFFF]", "", text)
+        # OLE 디코딩 과정에서 섞이는 비정상 문자도 여기서 함께 제거한다.
+        text = line.translate(_CLEAN_TRANSLATE_TABLE)
 
         if "\t" in text:
-            chunks = [re.sub(r"[ ]+", " ", chunk).strip() for chunk in text.split("\t")]
-            text = "\t".join(chunks)
-            text = re.sub(r"\t{2,}", "\t", text).strip()
+            # 셀 안의 공백 연속만 접고(전각 공백 등은 보존), 빈 셀을 빼고 이으면
+            # 탭 연속 축약과 양끝 탭 제거가 함께 처리된다.
+            chunks = (" ".join(filter(None, chunk.split(" "))).strip() for chunk in text.split("\t"))
+            text = "\t".join(chunk for chunk in chunks if chunk)
         else:
-            text = re.sub(r"\s+", " ", text).strip()
+            text = _WHITESPACE_RE.sub(" ", text).strip()
         if not text:
             return ""
 
-        hanja_subject = bool(re.match(r"^[甲乙丙丁戊己庚辛壬癸]\s*[은는이가을를의]", text))
-        hanja_marker_only = bool(re.fullmatch(r"[甲乙丙丁戊己庚辛壬癸]", text))
-
         # 한글/영문/숫자/문항 기호가 나오기 전의 깨진 선행 문자를 제거
-        # (단, 사례문 시작의 甲/乙 계열 라벨은 보존한다.)
-        if not hanja_subject and not hanja_marker_only:
-            text = re.sub(
-                r"^[^0-9A-Za-z가-힣①②③④⑤㉠㉡㉢㉣㉤㉥★<\[\(]+",
-                "",
-                text,
-            )
-        if not text:
-            return ""
+        # (단, 사례문 시작의 甲/乙 계열 라벨과 단독 甲 표기는 보존한다.)
+        # 대부분의 줄은 첫 글자부터 유효하므로 그때는 정규식 탐색을 건너뛴다.
+        first = text[0]
+        if first not in _LEADING_KEEP_CHARS and not "가" <= first <= "힣":
+            keep = _LEADING_KEEP_RE.search(text)
+            if keep is None:
+                return text if len(text) == 1 and text in _HANJA_LABELS else ""
+            hanja_subject = first in _HANJA_LABELS and text[1:].lstrip()[:1] in _HANJA_LABEL_JOSA
+            if not hanja_subject:
+                text = text[keep.start():]
 
         # 추출 과정에서 반복되는 무의미 1~2글자 노이즈 제거
-        if hanja_marker_only:
-            return text
-        if len(text) <= 2 and not re.search(
-            r"[0-9A-Za-z가-힣①②③④⑤]",
-            text,
-        ):
+        if len(text) <= 2 and not _CONTENT_CHAR_RE.search(text):
             return ""
-        if re.fullmatch(r"[-.=·•▪▫◦※*]+", text):
+        if _PUNCT_ONLY_CHARS.issuperset(text):
             return ""
         return text
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass, field
+from itertools import islice
 from typing import Any
 
 from .detector import (
@@ -8,43 +10,110 @@ from .detector import (
     DEFAULT_EXPLANATION_PATTERNS,
     DEFAULT_NEGATIVE_KEYWORDS,
     DEFAULT_QUESTION_PATTERNS,
+    compile_patterns,
     detect_file_type,
     detect_negative_keyword,
     extract_question_number,
     is_line_matching,
+    merge_patterns,
 )
 from .models import ExamDocument, ExamQuestion
 
 
-CIRCLE_FROM_DIGIT = {
-    "1": "①",
-    "2": "②",
-    "3": "③",
-    "4": "④",
-    "5": "⑤",
-}
+_DIGIT_TO_CIRCLE = str.maketrans("12345", "①②③④⑤")
+
+_CHOICE_MARKERS = frozenset("①②③④⑤")
+_SUB_ITEM_MARKERS = frozenset("㉠㉡㉢㉣㉤㉥")
+_CHOICE_OR_SUB_ITEM_MARKERS = _CHOICE_MARKERS | _SUB_ITEM_MARKERS
+_HEAVENLY_STEMS = frozenset("甲乙丙丁戊己庚辛壬癸")
+_TOPIC_PARTICLES = frozenset("은는이가을를의")
+# 내장 정규식이 맞을 수 있는 첫 글자(앞 공백 제외). 대부분의 본문 줄을 정규식 없이 걸러 낸다.
+_MARKER_LINE_FIRSTS = frozenset("[(【정해")
+_ANSWER_LINE_FIRSTS = frozenset("[(【정①②③④⑤12345")
+_EXPLANATION_MARKER_FIRSTS = frozenset("[(【정해참핵관")
+_TABLE_BLOCK_MARKER_FIRSTS = frozenset("<[〈「【사보자표")
+_LETTERED_TABLE_ROW_FIRSTS = frozenset("([")
+_NUMBER_DECORATION_FIRSTS = frozenset("★☆※＊*")
+# 문항 파싱 모드: 본문을 모으는 중 / 정답 이후 해설을 모으는 중
+_MODE_QUESTION = 0
+_MODE_EXPLANATION = 1
+# 표 블록 경계 종류: 계속 / 표 머리표(사례·보기 등) / 보기·정답·해설
+_TABLE_STOP_NONE = 0
+_TABLE_STOP_MARKER = 1
+_TABLE_STOP_BREAK = 2
+_QUESTION_START_HINTS = ("다음", "것은", "설명", "관련", "내용", "기술", "입장", "자유", "죄")
+_QUESTION_HEADER_HINTS = ("다음", "것은", "설명", "관련", "내용", "판례", "옳은", "틀린", "적절")
+
+
+def _is_cjk_ideograph(char: str) -> bool:
+    return "\u3400" <= char <= "\u9fff" or "\uf900" <= char <= "\ufaff"
+
+
+def _is_boxed_passage_noise(line: str) -> bool:
+    """표 머리에서 떨어져 나온 한자 두 글자(예: "甲乙")인지 확인한다."""
+    return len(line) == 2 and _is_cjk_ideograph(line[0]) and _is_cjk_ideograph(line[1])
+
+
+@dataclass(slots=True)
+class _QuestionCursor:
+    """파싱 중인 문항 하나의 상태."""
+
+    number: int | None = None
+    question_lines: list[str] = field(default_factory=list)
+    explanation_lines: list[str] = field(default_factory=list)
+    answer: str | None = None
+    answer_line: str | None = None
+    mode: int = _MODE_QUESTION
+
+    def has_content(self) -> bool:
+        return bool(self.question_lines or self.explanation_lines or self.answer or self.answer_line)
+
+    def reset(self) -> None:
+        self.question_lines = []
+        self.explanation_lines = []
+        self.answer = None
+        self.answer_line = None
+        self.mode = _MODE_QUESTION
 
 
 class ExamParser:
-    _BOXED_PASSAGE_START_RE = re.compile(r"^\s*[甲乙丙丁戊己庚辛壬癸]\s*[은는이가을를의]")
-    _QUESTION_PROMPT_RE = re.compile(r"[?？]\s*$")
-    _BOXED_PASSAGE_NOISE_RE = re.compile(r"^[\u3400-\u9FFF\uF900-\uFAFF]{2}$")
     _LEADING_NUMBER_DECORATION_RE = re.compile(r"^\s*[★☆※＊*]+\s*")
     _MARKER_LINE_RE = re.compile(r"^\s*[\[\(【]?\s*(정답|해설)\s*[\]\)】]?\s*[:：]?\s*$")
+    # 정답 줄 후보를 한 번의 매칭으로 가른다. 대안 순서가 곧 판정 우선순위다.
+    # 괄호 안 주석은 닫는 괄호를 포함할 수 없으므로 소유 수량자(++)로 되돌아가기를 막는다.
+    _ANSWER_LINE_RE = re.compile(
+        r"^\s*(?:"
+        r"(?P<labeled>[\[\(【]?\s*정답\s*[\]\)】]?\s*[:：]?\s*[\(\[]?\s*[①②③④⑤1-5]\s*[\)\]]?\s*(?:번)?(?:\s*[\(\[][^\)\]]++[\)\]])?)"
+        r"|(?P<annotated>[①②③④⑤1-5]\s*[\(\[][^\)\]]++[\)\]])"
+        r"|(?P<bare>[\(\[]?\s*[①②③④⑤1-5]\s*[\)\]]?)"
+        r")\s*$"
+    )
+    _EXPLANATION_MARKER_RE = re.compile(
+        r"^\s*[\[\(【]?\s*(?:"
+        r"(?:정답|해설)\s*[\]\)】]?\s*[:：]?\s*$"
+        r"|(?:해설|참고|핵심정리|관련\s*판례)"
+        r")"
+    )
     _TABLE_BLOCK_MARKER_RE = re.compile(
         r"^\s*[<\[〈「【]?\s*(사례|보기|자료|표)\s*(?:\d+)?\s*[>\]〉」】]?\s*$"
     )
     _LETTERED_TABLE_ROW_RE = re.compile(
         r"^\s*[\(\[]\s*([가나다라마바사아자차카타파하])\s*[\)\]]\s*(.*)$"
     )
-    _CHOICE_MARKER_RE = re.compile(r"^\s*([①②③④⑤])\s*(.*)$")
-    _SUB_ITEM_MARKER_RE = re.compile(r"^\s*(㉠|㉡|㉢|㉣|㉤|㉥)\s*(.*)$")
     _TABLE_CHOICE_TOKEN_RE = re.compile(
         r"^\s*(㉠|㉡|㉢|㉣|㉤|㉥)\s*(?:[\(\[]?\s*[xXoO○×]\s*[\)\]]?)?\s*$"
     )
     _TABLE_CHOICE_ROW_TOKEN_EXTRACT_RE = re.compile(
         r"(㉠|㉡|㉢|㉣|㉤|㉥)\s*([\(\[]?\s*[xXoO○×]\s*[\)\]]?)"
     )
+    # 사용자 설정 패턴이 번호 머리를 지우지 못했을 때 차례로 시도하는 기본 머리 패턴
+    _FALLBACK_QUESTION_PREFIX_RES = (
+        re.compile(r"^\s*문\s*(\d{1,2})\s*[\.\)]\s*"),
+        re.compile(r"^\s*(\d{1,2})\s*[\.\)]\s*"),
+        re.compile(r"^\s*(\d{1,2})\s+(?=[가-힣A-Za-z<\[\(])"),
+    )
+    _ANSWER_CIRCLE_RE = re.compile(r"[①②③④⑤]")
+    _ANSWER_DIGIT_RE = re.compile(r"(?<!\d)([1-5])(?!\d)")
 
     def __init__(self, config: dict[str, Any]) -> None:
         parsing = config.get("parsing", {})
@@ -59,8 +128,22 @@ class ExamParser:
         self.negative_keywords: list[str] = config.get(
             "negative_keywords", DEFAULT_NEGATIVE_KEYWORDS
         )
+        # 블록마다 다시 컴파일하지 않도록 설정 패턴을 한 번만 컴파일해 둔다.
+        # 정답/해설 패턴은 매칭 여부만 쓰므로 한 번에 검사하도록 합친다.
+        self._question_res = compile_patterns(self.question_patterns)
+        merged_question_res = merge_patterns(self._question_res)
+        self._question_number_re = merged_question_res[0] if len(merged_question_res) == 1 else None
+        self._answer_res = merge_patterns(self.answer_patterns)
+        self._explanation_res = merge_patterns(self.explanation_patterns)
+        # 같은 줄을 여러 번 판정하므로 파싱 한 번 동안만 결과를 기억해 둔다.
+        self._question_numbers: dict[str, int | None] = {}
+        self._answer_line_kinds: dict[str, str] = {}
+        self._explanation_marker_hits: dict[str, bool] = {}
 
     def parse_text_blocks(self, text_blocks: list[str], subject: str = "") -> ExamDocument:
+        self._question_numbers.clear()
+        self._answer_line_kinds.clear()
+        self._explanation_marker_hits.clear()
         clean_blocks = self._normalize_blocks(text_blocks)
         file_type = detect_file_type(
             clean_blocks,
@@ -83,72 +166,38 @@ class ExamParser:
         file_type: str,
     ) -> ExamDocument:
         document = ExamDocument(file_type=file_type, subject=subject, questions=[])
-        current_number: int | None = None
-        question_lines: list[str] = []
-        explanation_lines: list[str] = []
-        current_answer: str | None = None
-        current_answer_line: str | None = None
-        mode = "question"
-
-        def flush_current() -> None:
-            nonlocal current_number, question_lines, explanation_lines, current_answer, current_answer_line, mode
-            if current_number is None:
-                return
-            question = self._build_question(
-                number=current_number,
-                question_lines=question_lines,
-                answer=current_answer,
-                answer_line=current_answer_line,
-                explanation_lines=explanation_lines,
-            )
-            document.questions.append(question)
-            current_number = None
-            question_lines = []
-            explanation_lines = []
-            current_answer = None
-            current_answer_line = None
-            mode = "question"
-
-        for index, block in enumerate(clean_blocks):
-            next_block = clean_blocks[index + 1] if index + 1 < len(clean_blocks) else ""
-            number = extract_question_number(block, self.question_patterns)
+        cursor = _QuestionCursor()
+        # 블록마다 메서드를 다시 찾지 않도록 루프 밖에서 묶어 둔다.
+        question_number = self._question_number
+        consume_body_block = self._consume_body_block
+
+        next_blocks = clean_blocks[1:]
+        next_blocks.append("")
+        for block, next_block in zip(clean_blocks, next_blocks):
+            number = question_number(block)
             if number is not None:
                 if (
-                    current_number is not None
-                    and mode == "explanation"
+                    cursor.number is not None
+                    and cursor.mode == _MODE_EXPLANATION
                     and not self._is_probable_explicit_question_header(block, next_block)
                 ):
-                    explanation_lines.append(block)
+                    cursor.explanation_lines.append(block)
                     continue
-                flush_current()
-                current_number = number
+                if cursor.number is not None:
+                    self._flush_question(document, cursor, cursor.number)
+                cursor.number = number
                 stripped = self._strip_question_prefix(block)
                 if stripped:
-                    question_lines.append(stripped)
+                    cursor.question_lines.append(stripped)
                 continue
 
-            if current_number is None:
+            if cursor.number is None:
                 continue
 
-            if (mode == "question" or current_answer is None) and self._is_answer_line(block, next_block):
-                extracted_answer = self._extract_answer(block)
-                if extracted_answer:
-                    current_answer = extracted_answer
-                current_answer_line = block.strip() or None
-                mode = "explanation"
-                continue
-
-            if self._is_explanation_marker(block):
-                mode = "explanation"
-                if self._is_pure_explanation_marker(block):
-                    continue
-
-            if mode == "question":
-                question_lines.append(block)
-            else:
-                explanation_lines.append(block)
+            consume_body_block(cursor, block, next_block)
 
-        flush_current()
+        if cursor.number is not None:
+            self._flush_question(document, cursor, cursor.number)
         document.refresh_total_count()
         return document
 
@@ -159,175 +208,179 @@ class ExamParser:
         file_type: str,
     ) -> ExamDocument:
         document = ExamDocument(file_type=file_type, subject=subject, questions=[])
-        current_number = 0
-        question_lines: list[str] = []
-        explanation_lines: list[str] = []
-        current_answer: str | None = None
-        current_answer_line: str | None = None
-        mode = "question"
+        cursor = _QuestionCursor(number=0)
         has_started = False
-
-        def flush_current() -> None:
-            nonlocal current_number, question_lines, explanation_lines, current_answer, current_answer_line, mode
-            if not question_lines and not explanation_lines and not current_answer and not current_answer_line:
-                return
-            current_number += 1
-            question = self._build_question(
-                number=current_number,
-                question_lines=question_lines,
-                answer=current_answer,
-                answer_line=current_answer_line,
-                explanation_lines=explanation_lines,
-            )
-            document.questions.append(question)
-            question_lines = []
-            explanation_lines = []
-            current_answer = None
-            current_answer_line = None
-            mode = "question"
-
-        for index, block in enumerate(clean_blocks):
-            next_block = clean_blocks[index + 1] if index + 1 < len(clean_blocks) else ""
-            if self._is_probable_question_start(block):
-                if has_started:
-                    flush_current()
+        is_probable_question_start = self._is_probable_question_start
+        consume_body_block = self._consume_body_block
+
+        next_blocks = clean_blocks[1:]
+        next_blocks.append("")
+        for block, next_block in zip(clean_blocks, next_blocks):
+            if is_probable_question_start(block):
+                if has_started and cursor.has_content():
+                    cursor.number += 1
+                    self._flush_question(document, cursor, cursor.number)
                 has_started = True
-                mode = "question"
-                question_lines.append(block)
+                cursor.mode = _MODE_QUESTION
+                cursor.question_lines.append(block)
                 continue
 
             if not has_started:
                 continue
 
-            if (mode == "question" or current_answer is None) and self._is_answer_line(block, next_block):
-                extracted_answer = self._extract_answer(block)
-                if extracted_answer:
-                    current_answer = extracted_answer
-                current_answer_line = block.strip() or None
-                mode = "explanation"
-                continue
-
-            if self._is_explanation_marker(block):
-                mode = "explanation"
-                if self._is_pure_explanation_marker(block):
-                    continue
+            consume_body_block(cursor, block, next_block)
 
-            if mode == "question":
-                question_lines.append(block)
-            else:
-                explanation_lines.append(block)
-
-        flush_current()
+        if cursor.has_content():
+            cursor.number += 1
+            self._flush_question(document, cursor, cursor.number)
         document.refresh_total_count()
         return document
 
+    def _consume_body_block(self, cursor: _QuestionCursor, block: str, next_block: str) -> None:
+        """문항 번호 줄이 아닌 블록을 정답/해설/본문 중 알맞은 곳에 넣는다."""
+        if (cursor.mode == _MODE_QUESTION or cursor.answer is None) and self._is_answer_line(block, next_block):
+            extracted_answer = self._extract_answer(block)
+            if extracted_answer:
+                cursor.answer = extracted_answer
+            cursor.answer_line = block or None
+            cursor.mode = _MODE_EXPLANATION
+            return
+
+        if self._is_explanation_marker(block):
+            cursor.mode = _MODE_EXPLANATION
+            if self._is_pure_explanation_marker(block):
+                return
+
+        if cursor.mode == _MODE_QUESTION:
+            cursor.question_lines.append(block)
+        else:
+            cursor.explanation_lines.append(block)
+
+    def _flush_question(self, document: ExamDocument, cursor: _QuestionCursor, number: int) -> None:
+        document.questions.append(
+            self._build_question(
+                number=number,
+                question_lines=cursor.question_lines,
+                answer=cursor.answer,
+                answer_line=cursor.answer_line,
+                explanation_lines=cursor.explanation_lines,
+            )
+        )
+        cursor.reset()
+
+    def _question_number(self, text: str) -> int | None:
+        try:
+            return self._question_numbers[text]
+        except KeyError:
+            number = self._question_numbers[text] = extract_question_number(
+                text, self._question_res, self._question_number_re
+            )
+            return number
+
+    # 아래 판정 메서드들은 _normalize_blocks에서 strip()된 줄만 받으므로 다시 strip()하지 않는다.
     def _is_answer_line(self, text: str, next_text: str = "") -> bool:
-        if is_line_matching(text, self.answer_patterns):
-            return True
-        if re.match(
-            r"^\s*[\[\(【]?\s*정답\s*[\]\)】]?\s*[:：]?\s*[\(\[]?\s*[①②③④⑤1-5]\s*[\)\]]?\s*(?:번)?(\s*[\(\[][^\)\]]+[\)\]])?\s*$",
-            text,
-        ):
-            return True
-        if re.match(r"^\s*[①②③④⑤1-5]\s*[\(\[][^\)\]]+[\)\]]\s*$", text):
-            return True
-        if re.match(r"^\s*[\(\[]?\s*[①②③④⑤1-5]\s*[\)\]]?\s*$", text) and self._is_explanation_marker(next_text):
-            return True
-        return False
+        kind = self._answer_line_kinds.get(text)
+        if kind is None:
+            kind = self._answer_line_kinds[text] = self._classify_answer_line(text)
+        if kind == "bare":
+            return self._is_explanation_marker(next_text)
+        return kind == "answer"
+
+    def _classify_answer_line(self, text: str) -> str:
+        """정답 줄이면 "answer", 해설이 뒤따라야 정답인 숫자만 있는 줄이면 "bare"."""
+        if is_line_matching(text, self._answer_res):
+            return "answer"
+        if text[:1] not in _ANSWER_LINE_FIRSTS:
+            return "other"
+        match = self._ANSWER_LINE_RE.match(text)
+        if match is None:
+            return "other"
+        return "bare" if match.lastgroup == "bare" else "answer"
 
     def _is_explanation_marker(self, text: str) -> bool:
-        stripped = text.strip()
-        if self._MARKER_LINE_RE.match(stripped):
-            return True
-        if re.match(
-            r"^\s*[\[\(【]?\s*(해설|참고|핵심정리|관련\s*판례)\s*[\]\)】]?\s*[:：]?",
-            stripped,
-        ):
-            return True
-        return is_line_matching(text, self.explanation_patterns)
+        hit = self._explanation_marker_hits.get(text)
+        if hit is None:
+            hit = self._explanation_marker_hits[text] = bool(
+                (text[:1] in _EXPLANATION_MARKER_FIRSTS and self._EXPLANATION_MARKER_RE.match(text))
+                or is_line_matching(text, self._explanation_res)
+            )
+        return hit
 
     def _is_pure_explanation_marker(self, text: str) -> bool:
-        return bool(self._MARKER_LINE_RE.match(text.strip()))
+        return self._is_marker_line(text)
+
+    def _is_marker_line(self, stripped: str) -> bool:
+        return stripped[:1] in _MARKER_LINE_FIRSTS and bool(self._MARKER_LINE_RE.match(stripped))
 
     def _is_probable_question_start(self, text: str) -> bool:
-        stripped = text.strip()
-        if len(stripped) < 8:
+        if len(text) < 8:
             return False
-        if not re.search(r"[?？]", stripped):
+        if "?" not in text and "？" not in text:
             return False
-        if re.match(r"^\s*[①②③④⑤㉠㉡㉢㉣㉤㉥]", stripped):
+        if text[0] in _CHOICE_OR_SUB_ITEM_MARKERS:
             return False
-        if stripped.startswith(("[○]", "[×]")):
+        if text.startswith(("[○]", "[×]")):
             return False
-        if self._MARKER_LINE_RE.match(stripped):
+        if self._is_marker_line(text):
             return False
-        hints = ("다음", "것은", "설명", "관련", "내용", "기술", "입장", "자유", "죄")
-        return any(hint in stripped for hint in hints)
+        return any(hint in text for hint in _QUESTION_START_HINTS)
 
     def _is_probable_explicit_question_header(self, text: str, next_text: str = "") -> bool:
-        stripped = (text or "").strip()
-        if not stripped:
+        if not text:
             return False
-        if extract_question_number(stripped, self.question_patterns) is None:
+        if self._question_number(text) is None:
             return False
 
-        payload = self._strip_question_prefix(stripped).strip()
+        payload = self._strip_question_prefix(text)
         if not payload:
             return False
-        if re.search(r"[?？]", payload):
+        if "?" in payload or "？" in payload:
             return True
-        if self._MARKER_LINE_RE.match(payload):
-            return False
-        if self._CHOICE_MARKER_RE.match(payload):
+        if self._is_marker_line(payload):
             return False
-        if self._SUB_ITEM_MARKER_RE.match(payload):
+        if payload[0] in _CHOICE_OR_SUB_ITEM_MARKERS:
             return False
 
-        next_stripped = (next_text or "").strip()
-        if next_stripped and self._CHOICE_MARKER_RE.match(next_stripped):
+        if next_text[:1] in _CHOICE_MARKERS:
             return True
 
-        hints = ("다음", "것은", "설명", "관련", "내용", "판례", "옳은", "틀린", "적절")
-        if len(payload) >= 8 and any(hint in payload for hint in hints):
+        if len(payload) >= 8 and any(hint in payload for hint in _QUESTION_HEADER_HINTS):
             return True
         return False
 
     def _normalize_blocks(self, text_blocks: list[str]) -> list[str]:
-        normalized: list[str] = []
-        for block in text_blocks:
-            for line in re.split(r"\r?\n", block):
-                text = line.strip()
-                if text:
-                    normalized.append(text)
-        return normalized
+        # "\r\n"의 "\r"은 strip()이 지우므로 "\n"으로만 나눠도 된다.
+        # splitlines()는 \x0b, \x0c 등에서도 줄을 나눠 결과가 달라진다.
+        # 블록마다 나누지 않고 한 번 이어 붙인 뒤 한 번에 나눈다.
+        return [text for line in "\n".join(text_blocks).split("\n") if (text := line.strip())]
 
     def _strip_question_prefix(self, text: str) -> str:
-        candidate = self._LEADING_NUMBER_DECORATION_RE.sub("", text, count=1)
-        for pattern in self.question_patterns:
-            try:
-                stripped = re.sub(pattern, "", candidate, count=1).strip()
-            except re.error:
-                continue
+        if text[:1] in _NUMBER_DECORATION_FIRSTS:
+            candidate = self._LEADING_NUMBER_DECORATION_RE.sub("", text, count=1)
+        else:
+            candidate = text
+        # 설정 패턴은 __init__에서 한 번 컴파일해 두었고, 잘못된 패턴은 그때 걸러졌다.
+        for pattern in self._question_res:
+            stripped = pattern.sub("", candidate, count=1).strip()
             if stripped != candidate:
                 return stripped
-        fallback = re.sub(r"^\s*문\s*(\d{1,2})\s*[\.\)]\s*", "", candidate, count=1).strip()
-        if fallback != candidate.strip():
-            return fallback
-        fallback = re.sub(r"^\s*(\d{1,2})\s*[\.\)]\s*", "", candidate, count=1).strip()
-        if fallback != candidate.strip():
-            return fallback
-        fallback = re.sub(r"^\s*(\d{1,2})\s+(?=[가-힣A-Za-z<\[\(])", "", candidate, count=1).strip()
-        if fallback != candidate.strip():
-            return fallback
-        return candidate.strip()
+        # 기본 머리 패턴은 모두 숫자나 "문"으로 시작하는 줄에만 맞는다.
+        first = candidate[:1]
+        if not (first.isdecimal() or first == "문"):
+            return candidate
+        for pattern in self._FALLBACK_QUESTION_PREFIX_RES:
+            fallback = pattern.sub("", candidate, count=1).strip()
+            if fallback != candidate:
+                return fallback
+        return candidate
 
     def _extract_answer(self, text: str) -> str | None:
-        circle = re.search(r"[①②③④⑤]", text)
+        circle = self._ANSWER_CIRCLE_RE.search(text)
         if circle:
             return circle.group(0)
-        digit = re.search(r"(?<!\d)([1-5])(?!\d)", text)
+        digit = self._ANSWER_DIGIT_RE.search(text)
         if digit:
-            return CIRCLE_FROM_DIGIT.get(digit.group(1))
+            return digit.group(1).translate(_DIGIT_TO_CIRCLE)
         return None
 
     def _split_boxed_passage_lines(
@@ -339,20 +392,17 @@ class ExamParser:
         if len(body_lines) < 2:
             return body_lines, []
 
-        stem = (body_lines[0] or "").strip()
-        raw_passage_lines = [(line or "").strip() for line in body_lines[1:] if (line or "").strip()]
-        passage_lines = [
-            line for line in raw_passage_lines
-            if not self._BOXED_PASSAGE_NOISE_RE.fullmatch(line)
-        ]
-        if not passage_lines:
-            return body_lines, []
-        if not self._QUESTION_PROMPT_RE.search(stem):
+        # 줄은 모두 strip()되어 있으므로 물음표로 끝나는지만 보면 된다.
+        stem = body_lines[0]
+        if not stem.endswith(("?", "？")):
             return body_lines, []
 
-        first_line = passage_lines[0]
-        if self._BOXED_PASSAGE_START_RE.match(first_line):
-            return [stem], passage_lines
+        # 지문 목록은 첫 줄이 "甲은", "乙 이" 꼴일 때만 만든다.
+        first_line = next((line for line in islice(body_lines, 1, None) if not _is_boxed_passage_noise(line)), None)
+        if first_line is None:
+            return body_lines, []
+        if first_line[0] in _HEAVENLY_STEMS and first_line[1:].lstrip()[:1] in _TOPIC_PARTICLES:
+            return [stem], [line for line in body_lines[1:] if not _is_boxed_passage_noise(line)]
         return body_lines, []
 
     def _split_lettered_table_rows(
@@ -364,17 +414,12 @@ class ExamParser:
         if len(body_lines) < 3:
             return body_lines, []
 
-        stem = (body_lines[0] or "").strip()
-        if not stem:
-            return body_lines, []
-
+        stem = body_lines[0]
         rows: list[str] = []
         payload_lengths: list[int] = []
         index = 1
         while index < len(body_lines):
-            line = (body_lines[index] or "").strip()
-            if not line:
-                break
+            line = body_lines[index]
             match = self._LETTERED_TABLE_ROW_RE.match(line)
             if not match:
                 break
@@ -392,25 +437,37 @@ class ExamParser:
         if max(payload_lengths, default=0) < 12 and sum(payload_lengths) < 40:
             return body_lines, []
 
-        trailing = [line for line in body_lines[index:] if (line or "").strip()]
-        if trailing:
+        if index < len(body_lines):
             return body_lines, []
 
         return [stem], rows
 
     def _extract_marked_table_blocks(
-        self, question_lines: list[str],
-    ) -> tuple[list[list[str]], set[int]]:
+        self, stripped_lines: list[str],
+    ) -> tuple[list[list[str]], bytearray]:
+        """stripped_lines는 이미 strip()된 비어 있지 않은 문제 줄이다. 표 블록으로 소비된 줄은 1로 표시한다."""
         blocks: list[list[str]] = []
-        consumed_indices: set[int] = set()
+        line_count = len(stripped_lines)
+        consumed = bytearray(line_count)
+        stops = self._classify_table_stops(stripped_lines)
+        # marker_ahead[i]: i번째 줄부터 처음 만나는 경계가 표 머리표인지 여부
+        marker_ahead = bytearray(line_count + 1)
+        for index in range(line_count - 1, -1, -1):
+            stop = stops[index]
+            if stop == _TABLE_STOP_NONE:
+                marker_ahead[index] = marker_ahead[index + 1]
+            else:
+                marker_ahead[index] = stop == _TABLE_STOP_MARKER
         index = 0
 
-        while index < len(question_lines):
-            line = (question_lines[index] or "").strip()
-            starts_with_marker = bool(self._TABLE_BLOCK_MARKER_RE.match(line))
-            starts_with_lettered_row = bool(self._LETTERED_TABLE_ROW_RE.match(line))
+        while index < line_count:
+            line = stripped_lines[index]
+            starts_with_marker = stops[index] == _TABLE_STOP_MARKER
+            starts_with_lettered_row = line[:1] in _LETTERED_TABLE_ROW_FIRSTS and bool(
+                self._LETTERED_TABLE_ROW_RE.match(line)
+            )
             if starts_with_lettered_row and not starts_with_marker:
-                if not self._has_following_table_block_marker_before_choice(question_lines, index + 1):
+                if not marker_ahead[index + 1]:
                     index += 1
                     continue
             if not starts_with_marker and not starts_with_lettered_row:
@@ -420,44 +477,30 @@ class ExamParser:
             start = index
             block: list[str] = [line]
             index += 1
-            while index < len(question_lines):
-                current = (question_lines[index] or "").strip()
-                if self._TABLE_BLOCK_MARKER_RE.match(current):
-                    break
-                if re.match(r"^\s*[①②③④⑤]\s*", current):
-                    break
-                if self._is_answer_line(current):
-                    break
-                if self._is_explanation_marker(current):
-                    break
-                block.append(current)
+            while index < line_count and stops[index] == _TABLE_STOP_NONE:
+                block.append(stripped_lines[index])
                 index += 1
 
-            block = [item for item in block if item]
             if len(block) >= 2:
                 blocks.append(block)
-                consumed_indices.update(range(start, index))
+                consumed[start:index] = b"\x01" * (index - start)
             else:
                 index = start + 1
 
-        return blocks, consumed_indices
-
-    def _has_following_table_block_marker_before_choice(
-        self, question_lines: list[str], start_index: int,
-    ) -> bool:
-        index = start_index
-        while index < len(question_lines):
-            current = (question_lines[index] or "").strip()
-            if self._TABLE_BLOCK_MARKER_RE.match(current):
-                return True
-            if re.match(r"^\s*[①②③④⑤]\s*", current):
-                return False
-            if self._is_answer_line(current):
-                return False
-            if self._is_explanation_marker(current):
-                return False
-            index += 1
-        return False
+        return blocks, consumed
+
+    def _classify_table_stops(self, stripped_lines: list[str]) -> bytearray:
+        stops = bytearray(len(stripped_lines))
+        for index, line in enumerate(stripped_lines):
+            if line[:1] in _TABLE_BLOCK_MARKER_FIRSTS and self._TABLE_BLOCK_MARKER_RE.match(line):
+                stops[index] = _TABLE_STOP_MARKER
+            elif (
+                line[:1] in _CHOICE_MARKERS
+                or self._is_answer_line(line)
+                or self._is_explanation_marker(line)
+            ):
+                stops[index] = _TABLE_STOP_BREAK
+        return stops
 
     def _build_question(
         self,
@@ -470,50 +513,28 @@ class ExamParser:
         choices: list[str] = []
         sub_items: list[str] = []
         body_lines: list[str] = []
-        marked_table_blocks, consumed_indices = self._extract_marked_table_blocks(question_lines)
+        # 문제 줄은 모두 _normalize_blocks/_strip_question_prefix를 거친, strip()된 비어 있지 않은 줄이다.
+        marked_table_blocks, consumed = self._extract_marked_table_blocks(question_lines)
         detected_lettered_sub_items: list[str] = []
         current_choice_marker: str | None = None
         current_choice_parts: list[str] = []
 
-        def flush_choice() -> None:
-            nonlocal current_choice_marker, current_choice_parts
-            if current_choice_marker is None:
-                return
-
-            compact_parts = [part.strip() for part in current_choice_parts if part.strip()]
-            if not compact_parts:
-                choices.append(current_choice_marker)
-            elif len(compact_parts) == 1:
-                single = compact_parts[0]
-                normalized_row = self._normalize_table_choice_row(single)
-                if normalized_row is not None:
-                    choices.append(f"{current_choice_marker}\t{normalized_row}")
-                else:
-                    choices.append(f"{current_choice_marker} {single}".strip())
-            elif len(compact_parts) >= 2 and all(self._is_table_choice_token(part) for part in compact_parts):
-                choices.append(f"{current_choice_marker}\t" + "\t".join(compact_parts))
-            else:
-                choices.append(f"{current_choice_marker} {' '.join(compact_parts)}".strip())
-
-            current_choice_marker = None
-            current_choice_parts = []
-
-        for idx, line in enumerate(question_lines):
-            if idx in consumed_indices:
+        for line, is_consumed in zip(question_lines, consumed):
+            if is_consumed:
                 continue
-            stripped_line = (line or "").strip()
-            choice_match = self._CHOICE_MARKER_RE.match(stripped_line)
-            if choice_match:
-                segments = self._split_compound_choice_segments(stripped_line)
+            # 정규화된 줄은 이미 strip()되어 있어 보기 기호는 항상 첫 글자다.
+            if line[:1] in _CHOICE_MARKERS:
+                segments = self._split_compound_choice_segments(line)
                 if len(segments) > 1:
-                    flush_choice()
+                    if current_choice_marker is not None:
+                        self._append_choice(choices, current_choice_marker, current_choice_parts)
                     for marker, payload in segments[:-1]:
                         normalized_row = self._normalize_table_choice_row(payload)
                         if normalized_row is not None:
                             choices.append(f"{marker}\t{normalized_row}")
                         else:
                             payload_text = payload.strip()
-                            choices.append(f"{marker} {payload_text}".strip() if payload_text else marker)
+                            choices.append(f"{marker} {payload_text}" if payload_text else marker)
                     current_choice_marker = segments[-1][0]
                     current_choice_parts = []
                     last_payload = segments[-1][1].strip()
@@ -521,35 +542,33 @@ class ExamParser:
                         current_choice_parts.append(last_payload)
                     continue
 
-                flush_choice()
-                current_choice_marker = choice_match.group(1)
-                payload = choice_match.group(2).strip()
-                if payload:
-                    current_choice_parts.append(payload)
+                if current_choice_marker is not None:
+                    self._append_choice(choices, current_choice_marker, current_choice_parts)
+                current_choice_marker = line[0]
+                payload = line[1:].strip()
+                current_choice_parts = [payload] if payload else []
                 continue
 
             if current_choice_marker is not None:
-                stripped = (line or "").strip()
-                if self._is_table_choice_token(stripped):
-                    current_choice_parts.append(stripped)
+                if self._is_table_choice_token(line):
+                    current_choice_parts.append(line)
                     continue
-                sub_item_segments = self._split_compound_sub_item_segments(stripped)
-                if sub_item_segments:
-                    flush_choice()
-                    sub_items.extend(sub_item_segments)
+                sub_item_segments = self._split_compound_sub_item_segments(line)
+                if not sub_item_segments and self._looks_like_choice_continuation(line):
+                    current_choice_parts.append(line)
                     continue
-                if self._looks_like_choice_continuation(stripped):
-                    current_choice_parts.append(stripped)
-                    continue
-                flush_choice()
+                self._append_choice(choices, current_choice_marker, current_choice_parts)
+                current_choice_marker = None
+            else:
+                sub_item_segments = self._split_compound_sub_item_segments(line)
 
-            sub_item_segments = self._split_compound_sub_item_segments(stripped_line)
             if sub_item_segments:
                 sub_items.extend(sub_item_segments)
                 continue
             body_lines.append(line)
 
-        flush_choice()
+        if current_choice_marker is not None:
+            self._append_choice(choices, current_choice_marker, current_choice_parts)
 
         detected_boxed_sub_items: list[str] = []
         if not sub_items:
@@ -572,8 +591,9 @@ class ExamParser:
                 flattened.extend(sub_items)
             sub_items = flattened
 
-        question_text = "\n".join(body_lines).strip()
-        explanation = "\n".join(explanation_lines).strip() or None
+        # 모든 줄이 _normalize_blocks에서 strip()된 비어 있지 않은 줄이라 다시 strip()하지 않는다.
+        question_text = "\n".join(body_lines)
+        explanation = "\n".join(explanation_lines) if explanation_lines else None
         negative_keyword = detect_negative_keyword(question_text, self.negative_keywords)
         has_table = (
             len(sub_items) >= 2
@@ -595,6 +615,23 @@ class ExamParser:
             explanation=explanation,
         )
 
+    def _append_choice(self, choices: list[str], marker: str, parts: list[str]) -> None:
+        """보기 기호와 그 뒤에 이어 붙은 줄들을 보기 한 항목으로 합쳐 choices에 넣는다."""
+        compact_parts = [part.strip() for part in parts if part.strip()]
+        if not compact_parts:
+            choices.append(marker)
+        elif len(compact_parts) == 1:
+            single = compact_parts[0]
+            normalized_row = self._normalize_table_choice_row(single)
+            if normalized_row is not None:
+                choices.append(f"{marker}\t{normalized_row}")
+            else:
+                choices.append(f"{marker} {single}")
+        elif all(self._is_table_choice_token(part) for part in compact_parts):
+            choices.append(f"{marker}\t" + "\t".join(compact_parts))
+        else:
+            choices.append(f"{marker} {' '.join(compact_parts)}")
+
     def _is_table_choice_token(self, text: str) -> bool:
         stripped = (text or "").strip()
         if not stripped:
@@ -618,66 +655,55 @@ class ExamParser:
         stripped = (text or "").strip()
         if not stripped:
             return []
-        if not self._CHOICE_MARKER_RE.match(stripped):
+        if stripped[0] not in _CHOICE_MARKERS:
             return []
 
-        matches = list(re.finditer(r"[①②③④⑤]", stripped))
-        if len(matches) <= 1:
-            marker = stripped[0]
-            payload = stripped[1:].strip()
-            return [(marker, payload)]
-
-        segments: list[tuple[str, str]] = []
-        for index, match in enumerate(matches):
-            start = match.start()
-            end = matches[index + 1].start() if index + 1 < len(matches) else len(stripped)
-            chunk = stripped[start:end].strip()
-            if not chunk:
-                continue
-            marker = chunk[0]
-            payload = chunk[1:].strip()
-            segments.append((marker, payload))
-        return segments
+        # 기호가 하나뿐인 보통 줄은 C 수준 부분 문자열 검사만으로 끝낸다.
+        rest = stripped[1:]
+        if not any(marker in rest for marker in _CHOICE_MARKERS):
+            return [(stripped[0], rest.strip())]
+
+        positions = [index for index, char in enumerate(stripped) if char in _CHOICE_MARKERS]
+        positions.append(len(stripped))
+        return [
+            (stripped[start], stripped[start + 1:end].strip())
+            for start, end in zip(positions, positions[1:])
+        ]
 
     def _split_compound_sub_item_segments(self, text: str) -> list[str]:
         stripped = (text or "").strip()
         if not stripped:
             return []
-        if not self._SUB_ITEM_MARKER_RE.match(stripped):
+        if stripped[0] not in _SUB_ITEM_MARKERS:
             return []
 
-        marker_matches = list(re.finditer(r"[㉠㉡㉢㉣㉤㉥]", stripped))
-        if not marker_matches:
-            return []
+        rest = stripped[1:]
+        if not any(marker in rest for marker in _SUB_ITEM_MARKERS):
+            payload = rest.strip()
+            return [f"{stripped[0]} {payload}" if payload else stripped[0]]
 
-        chunks: list[str] = []
-        for index, match in enumerate(marker_matches):
-            start = match.start()
-            end = marker_matches[index + 1].start() if index + 1 < len(marker_matches) else len(stripped)
-            chunk = stripped[start:end].strip()
-            if not chunk:
-                continue
-            parts = self._SUB_ITEM_MARKER_RE.match(chunk)
-            if not parts:
-                continue
-            chunks.append(f"{parts.group(1)} {parts.group(2).strip()}".strip())
+        positions = [index for index, char in enumerate(stripped) if char in _SUB_ITEM_MARKERS]
+        positions.append(len(stripped))
+        chunks = [
+            f"{stripped[start]} {payload}" if (payload := stripped[start + 1:end].strip()) else stripped[start]
+            for start, end in zip(positions, positions[1:])
+        ]
 
         if len(chunks) >= 2 and all(self._is_table_choice_token(chunk) for chunk in chunks):
             return []
         return chunks
 
     def _looks_like_choice_continuation(self, text: str) -> bool:
-        stripped = (text or "").strip()
-        if not stripped:
+        if not text:
             return False
-        if self._CHOICE_MARKER_RE.match(stripped):
+        if text[0] in _CHOICE_MARKERS:
             return False
-        if self._MARKER_LINE_RE.match(stripped):
+        if self._is_marker_line(text):
             return False
-        if self._is_answer_line(stripped):
+        if self._is_answer_line(text):
             return False
-        if self._is_explanation_marker(stripped):
+        if self._is_explanation_marker(text):
             return False
-        if extract_question_number(stripped, self.question_patterns) is not None:
+        if self._question_number(text) is not None:
             return False
         return True
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 import re
 from typing import Callable, Optional
@@ -12,8 +13,21 @@ from .hwp_controller import HwpController
 from .models import ExamDocument
 from .parser import ExamParser
 
+_SUBJECT_KEYWORDS = ("경찰학", "형법", "형사소송법", "헌법", "행정법")
+
+
+@lru_cache(maxsize=256)
+def _subject_from_stem(stem: str) -> str:
+    for keyword in _SUBJECT_KEYWORDS:
+        if keyword in stem:
+            return keyword
+    return ""
+
 
 class ExamProcessingService:
+    _NUMBER_ONLY_RE = re.compile(r"^\s*\d{1,2}\s*$")
+    _ANSWER_ONLY_RE = re.compile(r"^\s*[①②③④⑤1-5](\s*[\(\[][^\)\]]++[\)\]])?\s*$")
+
     def __init__(self, config_manager: Optional[ConfigManager] = None) -> None:
         self.config_manager = config_manager or ConfigManager()
         self.last_warning = ""
@@ -55,22 +69,20 @@ class ExamProcessingService:
         return output_files
 
     def _infer_subject(self, file_path: str) -> str:
-        name = Path(file_path).stem
-        keywords = ["경찰학", "형법", "형사소송법", "헌법", "행정법"]
-        for keyword in keywords:
-            if keyword in name:
-                return keyword
-        return ""
+        return _subject_from_stem(Path(file_path).stem)
 
     def _looks_like_answer_key_sheet(self, text_blocks: list[str]) -> bool:
-        number_only = sum(1 for line in text_blocks if re.match(r"^\s*\d{1,2}\s*$", line))
-        answer_only = sum(
-            1
-            for line in text_blocks
-            if re.match(r"^\s*[①②③④⑤1-5](\s*[\(\[][^\)\]]+[\)\]])?\s*$", line)
-        )
-        question_like = sum(1 for line in text_blocks if re.search(r"[?？]", line))
-        return number_only >= 10 and answer_only >= 10 and question_like == 0
+        # "3"처럼 번호와 정답 둘 다로 셀 수 있는 줄이 있어 두 개수는 따로 센다.
+        number_only = 0
+        answer_only = 0
+        for line in text_blocks:
+            if "?" in line or "？" in line:
+                return False
+            if self._NUMBER_ONLY_RE.match(line):
+                number_only += 1
+            if self._ANSWER_ONLY_RE.match(line):
+                answer_only += 1
+        return number_only >= 10 and answer_only >= 10
 
     def _build_parse_diagnostic_message(self, text_blocks: list[str]) -> str:
         non_empty = [line.strip() for line in text_blocks if line and line.strip()]
@@ -1,18 +1,29 @@
 from __future__ import annotations
 
 import atexit
-import csv
 import json
 import os
 import signal
-import subprocess
 import sys
+from dataclasses import fields
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from .config_manager import ConfigManager
 from .models import ExamDocument, ExamQuestion
-from .service import ExamProcessingService
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on local environment
+    orjson = None
+
+_HWP_IMAGE_NAME = "hwp.exe"
+_PROCESS_TERMINATE = 0x0001
+_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+
+_QUESTION_FIELDS = frozenset(item.name for item in fields(ExamQuestion))
+# 기본값이 없는 필드만 채워 둔다. 나머지는 ExamQuestion 기본값을 따른다.
+_QUESTION_DEFAULTS = {"number": 0, "question_text": ""}
 
 _hwp_pids_before: set[int] = set()
 
@@ -23,9 +34,7 @@ def _can_terminate_pid(pid: int) -> bool:
     try:
         import ctypes
 
-        PROCESS_TERMINATE = 0x0001
-        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
-        access = PROCESS_TERMINATE | PROCESS_QUERY_LIMITED_INFORMATION
+        access = _PROCESS_TERMINATE | _PROCESS_QUERY_LIMITED_INFORMATION
         handle = ctypes.windll.kernel32.OpenProcess(access, False, int(pid))
         if not handle:
             return False
@@ -35,45 +44,94 @@ def _can_terminate_pid(pid: int) -> bool:
         return True
 
 
-def _get_hwp_pids(terminable_only: bool = False) -> set[int]:
-    """현재 실행 중인 Hwp.exe PID 목록."""
-    current_session_id: int | None = None
-    if os.name == "nt":
-        try:
-            import ctypes
-            import ctypes.wintypes
+def _terminate_pid_native(pid: int) -> bool:
+    """TerminateProcess로 프로세스를 바로 종료한다."""
+    import ctypes
+
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.OpenProcess(_PROCESS_TERMINATE, False, int(pid))
+    if not handle:
+        return False
+    try:
+        return bool(kernel32.TerminateProcess(handle, 1))
+    finally:
+        kernel32.CloseHandle(handle)
 
-            sid = ctypes.wintypes.DWORD()
-            if ctypes.windll.kernel32.ProcessIdToSessionId(int(os.getpid()), ctypes.byref(sid)):
-                current_session_id = int(sid.value)
-        except Exception:
-            current_session_id = None
 
+@lru_cache(maxsize=1)
+def _get_current_session_id() -> int | None:
+    """현재 프로세스의 세션 ID. 한 번만 조회해 둔다."""
+    return _get_session_id(os.getpid())
+
+
+def _get_session_id(pid: int) -> int | None:
     try:
-        creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
-        result = subprocess.run(
-            ["tasklist", "/FI", "IMAGENAME eq Hwp.exe", "/FO", "CSV", "/NH"],
-            capture_output=True, text=True, timeout=5,
-            creationflags=creationflags,
-        )
+        import ctypes
+        import ctypes.wintypes
+
+        sid = ctypes.wintypes.DWORD()
+        if ctypes.windll.kernel32.ProcessIdToSessionId(int(pid), ctypes.byref(sid)):
+            return int(sid.value)
+    except Exception:
+        pass
+    return None
+
+
+def _enum_process_ids() -> list[int]:
+    import ctypes
+    import ctypes.wintypes
+
+    capacity = 1024
+    while True:
+        pids = (ctypes.wintypes.DWORD * capacity)()
+        returned = ctypes.wintypes.DWORD()
+        if not ctypes.windll.psapi.EnumProcesses(pids, ctypes.sizeof(pids), ctypes.byref(returned)):
+            return []
+        count = returned.value // ctypes.sizeof(ctypes.wintypes.DWORD)
+        if count < capacity:
+            return list(pids[:count])
+        # 배열이 가득 찼으면 잘렸을 수 있으므로 늘려서 다시 읽는다.
+        capacity *= 2
+
+
+def _get_process_image_name(pid: int) -> str:
+    import ctypes
+    import ctypes.wintypes
+
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, int(pid))
+    if not handle:
+        return ""
+    try:
+        buffer = ctypes.create_unicode_buffer(1024)
+        size = ctypes.wintypes.DWORD(len(buffer))
+        if not kernel32.QueryFullProcessImageNameW(handle, 0, buffer, ctypes.byref(size)):
+            return ""
+        return buffer.value
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+def _get_hwp_pids(terminable_only: bool = False) -> set[int]:
+    """현재 세션에서 실행 중인 Hwp.exe PID 목록."""
+    if os.name != "nt":
+        return set()
+    try:
+        current_session_id = _get_current_session_id()
         pids: set[int] = set()
-        for parts in csv.reader(result.stdout.strip().splitlines()):
-            if len(parts) >= 2:
-                try:
-                    pid = int(parts[1].strip('"'))
-                except ValueError:
-                    pass
-                else:
-                    if current_session_id is not None and len(parts) >= 4:
-                        try:
-                            session_id = int(parts[3].strip('"'))
-                        except ValueError:
-                            session_id = None
-                        if session_id is not None and session_id != current_session_id:
-                            continue
-                    if terminable_only and not _can_terminate_pid(pid):
-                        continue
-                    pids.add(pid)
+        for pid in _enum_process_ids():
+            if not pid:
+                continue
+            image_name = _get_process_image_name(pid)
+            if os.path.basename(image_name).lower() != _HWP_IMAGE_NAME:
+                continue
+            if current_session_id is not None:
+                session_id = _get_session_id(pid)
+                if session_id is not None and session_id != current_session_id:
+                    continue
+            if terminable_only and not _can_terminate_pid(pid):
+                continue
+            pids.add(pid)
         return pids
     except Exception:
         return set()
@@ -84,14 +142,9 @@ def _cleanup_orphaned_hwp() -> None:
     orphaned = _get_hwp_pids(terminable_only=True) - _hwp_pids_before
     if not orphaned:
         return
-    creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
     for pid in orphaned:
         try:
-            subprocess.run(
-                ["taskkill", "/F", "/PID", str(pid)],
-                capture_output=True, timeout=5,
-                creationflags=creationflags,
-            )
+            _terminate_pid_native(pid)
         except Exception:
             pass
 
@@ -102,22 +155,11 @@ def _on_sigterm(signum, frame):
 
 
 def _payload_to_document(payload: dict[str, Any]) -> ExamDocument:
-    questions: list[ExamQuestion] = []
-    for item in payload.get("questions", []):
-        questions.append(
-            ExamQuestion(
-                number=int(item.get("number", 0)),
-                question_text=str(item.get("question_text", "")),
-                choices=list(item.get("choices", [])),
-                sub_items=list(item.get("sub_items", [])),
-                has_table=bool(item.get("has_table", False)),
-                has_negative=bool(item.get("has_negative", False)),
-                negative_keyword=str(item.get("negative_keyword", "")),
-                answer_line=item.get("answer_line"),
-                answer=item.get("answer"),
-                explanation=item.get("explanation"),
-            )
-        )
+    # GUI의 _document_to_payload는 ExamQuestion 필드 이름과 타입을 그대로 쓰므로 필드별로 변환하지 않는다.
+    questions = [
+        ExamQuestion(**{**_QUESTION_DEFAULTS, **{key: value for key, value in item.items() if key in _QUESTION_FIELDS}})
+        for item in payload.get("questions", [])
+    ]
     return ExamDocument(
         file_type=str(payload.get("file_type", "")),
         subject=str(payload.get("subject", "")),
@@ -126,8 +168,20 @@ def _payload_to_document(payload: dict[str, Any]) -> ExamDocument:
     )
 
 
+def _dumps_json(data: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def _loads_json(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def _write_result(path: Path, result: dict[str, Any]) -> None:
-    path.write_text(json.dumps(result, ensure_ascii=False), encoding="utf-8")
+    path.write_bytes(_dumps_json(result))
 
 
 def main(argv: list[str]) -> int:
@@ -149,6 +203,13 @@ def main(argv: list[str]) -> int:
     initialized = False
 
     try:
+        request = _loads_json(request_path.read_bytes())
+        source_file = str(request.get("source_file", ""))
+        document_payload = request.get("document", {})
+        document = _payload_to_document(document_payload)
+        force_disable_style = bool(request.get("force_disable_style", False))
+
+        # 요청을 읽은 뒤에야 COM과 생성기 모듈을 불러온다. 잘못된 요청이면 이 비용을 치르지 않는다.
         try:
             import pythoncom as _pythoncom
 
@@ -158,11 +219,8 @@ def main(argv: list[str]) -> int:
         except Exception:
             initialized = False
 
-        request = json.loads(request_path.read_text(encoding="utf-8"))
-        source_file = str(request.get("source_file", ""))
-        document_payload = request.get("document", {})
-        document = _payload_to_document(document_payload)
-        force_disable_style = bool(request.get("force_disable_style", False))
+        from .config_manager import ConfigManager
+        from .service import ExamProcessingService
 
         progress_path = request_path.parent / "progress.txt"
 
@@ -1,6 +1,12 @@
 import unittest
 
-from core.detector import detect_file_type, detect_negative_keyword, extract_question_number
+from core.detector import (
+    detect_file_type,
+    detect_negative_keyword,
+    extract_question_number,
+    is_line_matching,
+    merge_patterns,
+)
 
 
 class DetectorTestCase(unittest.TestCase):
@@ -80,5 +86,27 @@ class DetectorTestCase(unittest.TestCase):
         self.assertEqual(detect_negative_keyword("다음 중 않은 것은?"), "않은")
 
 
+    def test_merge_patterns_combines_plain_patterns(self) -> None:
+        merged = merge_patterns([r"^\s*정답\s+[①②③④⑤]", r"^\s*정답\s*[:：]\s*\d", "("])
+        self.assertEqual(len(merged), 1)
+        self.assertTrue(is_line_matching("정답 ③", merged))
+        self.assertTrue(is_line_matching("정답: 2", merged))
+        self.assertFalse(is_line_matching("해설 정답 ③", merged))
+
+    def test_merge_patterns_keeps_backreference_patterns_separate(self) -> None:
+        merged = merge_patterns([r"^(\d)\1", r"^x"])
+        self.assertEqual(len(merged), 2)
+        self.assertTrue(is_line_matching("11", merged))
+        self.assertFalse(is_line_matching("12", merged))
+
+
+    def test_extract_question_number_with_combined_pattern(self) -> None:
+        patterns = [r"^(0)\.", r"^0\.(\d)"]
+        combined = merge_patterns(patterns)[0]
+        self.assertEqual(extract_question_number("12. 문제", patterns, combined), 12)
+        # 합친 식의 첫 매칭("0.")이 버려지면 다음 패턴까지 확인한다.
+        self.assertEqual(extract_question_number("0.7", patterns, combined), 7)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,10 @@
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
 
-from core.generator import OutputGenerator
-from core.models import ExamQuestion
+from core.generator import OutputGenerator, _OutputPaths
+from core.models import ExamDocument, ExamQuestion
 
 
 def _make_generator(sub_items_table: bool = True) -> OutputGenerator:
@@ -97,7 +100,7 @@ class GeneratorSubItemsTablePolicyTestCase(unittest.TestCase):
         sub_items = ["㉠ alpha", "㉡ beta"]
         generator._insert_sub_items_block(object(), sub_items, question_number=1, prefer_table=True)
 
-        self.assertEqual(inserted, ["㉠ alpha\r\n", "㉡ beta\r\n"])
+        self.assertEqual(inserted, ["㉠ alpha\r\n㉡ beta\r\n"])
         merged = "".join(inserted)
         self.assertNotIn("┌", merged)
         self.assertNotIn("└", merged)
@@ -191,7 +194,7 @@ class GeneratorSubItemsTablePolicyTestCase(unittest.TestCase):
         generator.formatter.apply_question_inline_char = lambda hwp, emphasize=False: None
         generator.formatter.apply_choice_format = lambda hwp: None
         generator._insert_text = lambda hwp, text: None
-        generator._insert_question_text_with_emphasis = lambda hwp, text, keyword: None
+        generator._insert_question_text_with_emphasis = lambda hwp, text, keyword, buffer=None: None
         generator._leave_table_context = lambda hwp: True
 
         calls: list[dict[str, object]] = []
@@ -318,7 +321,378 @@ class GeneratorSubItemsTablePolicyTestCase(unittest.TestCase):
             explanation=None,
         )
         generator._insert_explanation_block(object(), question)
-        self.assertEqual(inserted[0], "1. [정답] (②)\r\n")
+        self.assertEqual(inserted, ["1. [정답] (②)\r\n\r\n"])
+
+    def test_question_header_is_inserted_once_around_emphasis(self) -> None:
+        generator = _make_generator(True)
+        events: list[str] = []
+        generator.formatter.apply_question_format = lambda hwp, emphasize=False: events.append("format")
+        generator.formatter.apply_question_inline_char = (
+            lambda hwp, emphasize=False: events.append(f"inline:{emphasize}")
+        )
+        generator._leave_table_context = lambda hwp: True
+        generator._insert_text = lambda hwp, text: events.append(text)
+
+        question = ExamQuestion(
+            number=3,
+            question_text="다음 중 옳지 않은 것은?",
+            negative_keyword="않은",
+        )
+        generator._insert_question_block(object(), question)
+
+        self.assertEqual(
+            events,
+            [
+                "format",
+                "inline:False",
+                "3. 다음 중 옳지 ",
+                "inline:True",
+                "않은",
+                "inline:False",
+                " 것은?\r\n\r\n",
+            ],
+        )
+
+
+    def test_choice_lines_and_trailing_newline_are_inserted_once(self) -> None:
+        generator = _make_generator(True)
+        events: list[str] = []
+        generator.formatter.apply_question_format = lambda hwp, emphasize=False: events.append("question")
+        generator.formatter.apply_choice_format = lambda hwp: events.append("choice")
+        generator._leave_table_context = lambda hwp: True
+        generator._insert_text = lambda hwp, text: events.append(text)
+
+        question = ExamQuestion(
+            number=1,
+            question_text="질문",
+            choices=["① 첫 번째 선지는 한 줄에 모두 담기 어려울 만큼 충분히 길게 작성한 문장입니다", "② 둘째"],
+        )
+        generator._insert_question_block(object(), question)
+
+        self.assertEqual(events[-2], "choice")
+        self.assertEqual(
+            events[-1],
+            "① 첫 번째 선지는 한 줄에 모두 담기 어려울 만큼 충분히 길게 작성한 문장입니다\r\n② 둘째\r\n\r\n",
+        )
+
+    def test_heartbeat_formats_message_only_with_progress_callback(self) -> None:
+        generator = _make_generator(True)
+
+        class _Number:
+            formatted = 0
+
+            def __str__(self) -> str:
+                _Number.formatted += 1
+                return "7"
+
+        generator._heartbeat("문제 %s: 시작", _Number())
+        self.assertEqual(_Number.formatted, 0)
+
+        messages: list[str] = []
+        generator._on_progress = lambda pct, msg: messages.append(msg)
+        generator._heartbeat("문제 %s: 시작", _Number())
+        self.assertEqual(messages, ["문제 7: 시작"])
+
+class GeneratorOutputPathsTestCase(unittest.TestCase):
+    def test_output_paths_share_stem_and_timestamp(self) -> None:
+        paths = _OutputPaths.build(Path("out"), "헌법", "20260101_000000")
+        self.assertEqual(paths.question_hwp, Path("out") / "헌법_question_sheet_20260101_000000.hwp")
+        self.assertEqual(paths.explanation_txt, Path("out") / "헌법_explanation_sheet_20260101_000000.txt")
+
+    def test_sanitize_filename_strips_control_and_surrogate_chars(self) -> None:
+        generator = _make_generator(True)
+        source = "헌법\x00\x1f\x85\ud800 1주차:정답?"
+        self.assertEqual(generator._sanitize_filename_component(source), "헌법 1주차_정답_")
+        self.assertEqual(generator._sanitize_filename_component("\x01\x02"), "exam")
+
+    def test_txt_fallback_uses_sanitized_stem_for_both_sheets(self) -> None:
+        generator = _make_generator(True)
+        generator._try_generate_hwp = lambda document, paths, on_progress=None: []
+        document = ExamDocument(
+            file_type="TYPE_A",
+            subject="",
+            questions=[ExamQuestion(number=1, question_text="문제", answer="①")],
+        )
+        document.refresh_total_count()
+        with tempfile.TemporaryDirectory() as tmp:
+            files = generator.generate(document, tmp, "a:b")
+            names = [Path(path).name for path in files]
+        self.assertEqual(len(names), 2)
+        self.assertTrue(names[0].startswith("a_b_question_sheet_"))
+        self.assertTrue(names[1].startswith("a_b_explanation_sheet_"))
+        self.assertEqual(names[0].rsplit("_", 2)[1:], names[1].rsplit("_", 2)[1:])
+
+
+    def test_txt_sheets_render_questions_and_answers(self) -> None:
+        generator = _make_generator(True)
+        document = ExamDocument(
+            file_type="TYPE_A",
+            subject="",
+            questions=[
+                ExamQuestion(number=1, question_text="문제", choices=["① 가", "② 나"], answer="②", explanation="해설"),
+            ],
+        )
+        document.refresh_total_count()
+        with tempfile.TemporaryDirectory() as tmp:
+            question_path = Path(tmp) / "q.txt"
+            explanation_path = Path(tmp) / "e.txt"
+            generator._write_question_sheet_txt(question_path, document)
+            generator._write_explanation_sheet_txt(explanation_path, document)
+            question_text = question_path.read_text(encoding="utf-8")
+            explanation_text = explanation_path.read_text(encoding="utf-8")
+        self.assertEqual(question_text, "[문제지]\n유형: TYPE_A\n문항 수: 1\n\n01. 문제\n① 가\n② 나\n\n")
+        self.assertEqual(explanation_text, "[해설지]\n유형: TYPE_A\n문항 수: 1\n\n01. 정답 ②\n해설\n\n")
+
+class GeneratorHwpInstanceReuseTestCase(unittest.TestCase):
+    def test_type_a_run_reuses_single_hwp_instance(self) -> None:
+        generator = _make_generator(True)
+        calls: list[str] = []
+        hwp = object()
+        generator._open_hwp_document = lambda target_path=None: calls.append("open") or hwp
+        generator._reopen_hwp_document = lambda h, target_path=None: calls.append("reopen")
+        generator._write_question_sheet_hwp = lambda h, path, document, on_progress=None, has_explanation=False: calls.append("question")
+        generator._write_explanation_sheet_hwp = lambda h, path, document, on_progress=None: calls.append("explanation")
+        generator._quit_hwp = lambda h, background_wait=False: calls.append("quit")
+        generator._post_process_question_sheet = lambda path: calls.append("post_question")
+        generator._post_process_explanation_sheet = lambda path: calls.append("post_explanation")
+
+        document = ExamDocument(file_type="TYPE_A", subject="", questions=[])
+        paths = _OutputPaths.build(Path("out"), "exam", "20260101_000000")
+        with mock.patch("core.generator.win32", object()):
+            files = generator._try_generate_hwp(document, paths)
+
+        self.assertEqual(files, [str(paths.question_hwp), str(paths.explanation_hwp)])
+        self.assertEqual(
+            calls,
+            ["open", "question", "reopen", "explanation", "quit", "post_question", "post_explanation"],
+        )
+
+    def test_explanation_failure_still_quits_once_and_returns_empty(self) -> None:
+        generator = _make_generator(True)
+        calls: list[str] = []
+
+        def _fail(*args, **kwargs):
+            raise RuntimeError("HWPFrame.HwpObject.SaveAs")
+
+        generator._open_hwp_document = lambda target_path=None: object()
+        generator._reopen_hwp_document = lambda h, target_path=None: None
+        generator._write_question_sheet_hwp = lambda *args, **kwargs: None
+        generator._write_explanation_sheet_hwp = _fail
+        generator._quit_hwp = lambda h, background_wait=False: calls.append("quit")
+        generator._post_process_question_sheet = lambda path: None
+
+        document = ExamDocument(file_type="TYPE_A", subject="", questions=[])
+        paths = _OutputPaths.build(Path("out"), "exam", "20260101_000000")
+        with mock.patch("core.generator.win32", object()):
+            files = generator._try_generate_hwp(document, paths)
+
+        self.assertEqual(files, [])
+        self.assertEqual(calls, ["quit"])
+        self.assertEqual(generator._last_hwp_error, "HWPFrame.HwpObject.SaveAs")
+
+
+class GeneratorTemplateBodyClearTestCase(unittest.TestCase):
+    def _load(self, template_body_empty: bool) -> list[str]:
+        generator = OutputGenerator(
+            {"style": {"enabled": False, "template_body_empty": template_body_empty}}
+        )
+        generator._resolved_template_path = Path("template.hwp")
+        generator._module_registered = True
+        calls: list[str] = []
+        generator._open_template_document = lambda hwp, path: True
+        generator._prepare_document_from_template = lambda hwp: calls.append("clear")
+        generator._load_hwp_document(object())
+        return calls
+
+    def test_template_body_is_cleared_by_default(self) -> None:
+        self.assertEqual(self._load(False), ["clear"])
+
+    def test_empty_template_body_skips_clear(self) -> None:
+        self.assertEqual(self._load(True), [])
+
+
+class GeneratorMessageBoxModeTestCase(unittest.TestCase):
+    def test_silent_mode_is_applied_once_per_instance(self) -> None:
+        generator = _make_generator(True)
+        modes: list[int] = []
+
+        class _HwpStub:
+            @staticmethod
+            def SetMessageBoxMode(mode: int) -> None:
+                modes.append(mode)
+
+        hwp = _HwpStub()
+        generator._set_silent_message_boxes(hwp)
+        generator._set_silent_message_boxes(hwp)
+        generator._restore_message_boxes(hwp)
+        self.assertEqual(modes, [0x000F0000, 0x00000000])
+
+
+class GeneratorComHandleCacheTestCase(unittest.TestCase):
+    def test_insert_text_resolves_parameter_set_once_per_instance(self) -> None:
+        generator = _make_generator(True)
+        lookups: list[str] = []
+        executed: list[str] = []
+
+        class _InsertText:
+            HSet = object()
+            Text = ""
+
+        class _ParameterSet:
+            _insert = _InsertText()
+
+            @property
+            def HInsertText(self):
+                lookups.append("HInsertText")
+                return self._insert
+
+        class _Action:
+            @staticmethod
+            def GetDefault(name, hset) -> None:
+                return None
+
+            @staticmethod
+            def Execute(name, hset) -> bool:
+                executed.append(_ParameterSet._insert.Text)
+                return True
+
+        class _Hwp:
+            @property
+            def HAction(self):
+                lookups.append("HAction")
+                return _Action()
+
+            @property
+            def HParameterSet(self):
+                lookups.append("HParameterSet")
+                return _ParameterSet()
+
+        hwp = _Hwp()
+        generator._insert_text(hwp, "a\n")
+        generator._insert_text(hwp, "b")
+        self.assertEqual(executed, ["a\r\n", "b"])
+        self.assertEqual(sorted(lookups), ["HAction", "HInsertText", "HParameterSet"])
+
+        generator._release_com_handles(hwp)
+        self.assertEqual(generator._com_handles, {})
+
+
+class GeneratorTableContextTestCase(unittest.TestCase):
+    def _make_hwp(self, runs: list[str], table_cell_results: list[bool]):
+        class _Action:
+            @staticmethod
+            def Run(name) -> bool:
+                runs.append(name)
+                if name == "TableCellBlock":
+                    return table_cell_results.pop(0) if table_cell_results else False
+                return True
+
+        class _Hwp:
+            HAction = _Action()
+
+        return _Hwp()
+
+    def test_leave_without_created_table_skips_com_calls(self) -> None:
+        generator = _make_generator(True)
+        runs: list[str] = []
+
+        self.assertTrue(generator._leave_table_context(self._make_hwp(runs, [])))
+        self.assertEqual(runs, [])
+
+    def test_leave_after_table_probes_before_repeating_close(self) -> None:
+        generator = _make_generator(True)
+        generator._in_table_context = True
+        runs: list[str] = []
+
+        self.assertTrue(generator._leave_table_context(self._make_hwp(runs, [False])))
+        self.assertEqual(runs, ["CloseEx", "Cancel", "TableCellBlock"])
+        self.assertFalse(generator._in_table_context)
+
+
+    def test_treat_as_char_walks_table_controls_once(self) -> None:
+        generator = _make_generator(True)
+        walks: list[str] = []
+
+        class _Props:
+            def __init__(self) -> None:
+                self.values: dict[str, int] = {}
+
+            def SetItem(self, key, value) -> None:
+                self.values[key] = value
+
+            def Item(self, key):
+                return self.values.get(key, 0)
+
+        class _Table:
+            CtrlID = "tbl"
+            ParentCtrl = None
+
+            def __init__(self) -> None:
+                self.Properties = _Props()
+
+        table = _Table()
+
+        def _iter(hwp):
+            walks.append("walk")
+            yield table
+
+        class _Hwp:
+            def CreateAction(self, name):
+                raise RuntimeError("unsupported")
+
+        generator._iter_current_table_controls = _iter
+        self.assertTrue(generator._set_current_table_treat_as_char(_Hwp()))
+        self.assertEqual(walks, ["walk"])
+        self.assertEqual(table.Properties.values, {"TreatAsChar": 1})
+
+
+class GeneratorSaveAsTestCase(unittest.TestCase):
+    def test_filesaveas_sets_parameters_through_hset_only(self) -> None:
+        generator = _make_generator(True)
+        calls: list[tuple] = []
+
+        class _HSet:
+            def SetItem(self, key, value) -> None:
+                calls.append(("SetItem", key, value))
+
+        class _FileOpenSave:
+            HSet = _HSet()
+
+            def __setattr__(self, name, value) -> None:
+                calls.append(("setattr", name, value))
+
+        class _ParameterSet:
+            HFileOpenSave = _FileOpenSave()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            target = Path(tmp) / "out.hwp"
+
+            class _Action:
+                @staticmethod
+                def GetDefault(name, hset) -> None:
+                    calls.append(("GetDefault", name))
+
+                @staticmethod
+                def Execute(name, hset) -> bool:
+                    calls.append(("Execute", name))
+                    target.write_bytes(b"hwp")
+                    return True
+
+            class _Hwp:
+                HAction = _Action()
+                HParameterSet = _ParameterSet()
+
+            generator._save_hwp(_Hwp(), target)
+
+        self.assertEqual(
+            calls,
+            [
+                ("GetDefault", "FileSaveAs_S"),
+                ("SetItem", "FileName", str(target)),
+                ("SetItem", "Format", "HWP"),
+                ("Execute", "FileSaveAs_S"),
+            ],
+        )
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 import unittest
+import zlib
 
 from core.hwp_controller import HwpController
 
@@ -20,5 +21,27 @@ class HwpControllerLineCleanupTestCase(unittest.TestCase):
         self.assertEqual(self.controller._clean_line(line), line)
 
 
+    def test_clean_line_scrubs_controls_and_decoding_noise(self) -> None:
+        line = "\x00문제\x01본문\u0301\uFFFF 가⋅나･다"
+        self.assertEqual(self.controller._clean_line(line), "문제 본문 가·나·다")
+
+
+class HwpControllerFileHeaderTestCase(unittest.TestCase):
+    def test_parse_hwp_flags_reads_attribute_field(self) -> None:
+        header = b"HWP Document File".ljust(32, b"\x00") + b"\x00\x00\x05\x05" + b"\x03\x00\x00\x00"
+        self.assertEqual(HwpController._parse_hwp_flags(header), 0x03)
+
+    def test_parse_hwp_flags_treats_short_header_as_plain(self) -> None:
+        self.assertEqual(HwpController._parse_hwp_flags(b"HWP"), 0)
+
+    def test_decompress_sections_keeps_section_order(self) -> None:
+        def _deflate(data: bytes) -> bytes:
+            compressor = zlib.compressobj(wbits=-15)
+            return compressor.compress(data) + compressor.flush()
+
+        raw = [f"section-{index}".encode("utf-8") * 50 for index in range(5)]
+        restored = HwpController()._decompress_sections([_deflate(data) for data in raw])
+        self.assertEqual(restored, raw)
+
 if __name__ == "__main__":
     unittest.main()
@@ -375,5 +375,30 @@ class ParserTestCase(unittest.TestCase):
         self.assertEqual(question.sub_items[3], "㉣ 네 번째 설명")
 
 
+    def test_answer_line_classification_is_reused_within_a_parse(self) -> None:
+        calls: list[str] = []
+        classify = self.parser._classify_answer_line
+
+        def counting_classify(text: str) -> str:
+            calls.append(text)
+            return classify(text)
+
+        self.parser._classify_answer_line = counting_classify
+        blocks = ["01. 다음 중 옳은 것은?", "① 보기1", "정답 ①", "해설 : 설명"]
+
+        self.parser.parse_text_blocks(blocks)
+        first_calls = len(calls)
+        self.assertEqual(len(set(calls)), first_calls)
+
+        self.parser.parse_text_blocks(blocks)
+        self.assertEqual(len(calls), first_calls * 2)
+
+    def test_unclosed_answer_annotation_is_not_an_answer_line(self) -> None:
+        line = "① (" + "(" * 5000 + " 해설"
+        self.assertFalse(self.parser._is_answer_line(line))
+        self.assertTrue(self.parser._is_answer_line("정답 ① (판례)"))
+        self.assertTrue(self.parser._is_answer_line("③ [2021도1234]"))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -22,6 +22,14 @@ class ServiceDiagnosticTestCase(unittest.TestCase):
         self.assertIn("파일 앞부분 샘플", message)
         self.assertIn("확인사항", message)
 
+    def test_looks_like_answer_key_sheet(self) -> None:
+        blocks: list[str] = []
+        for number in range(1, 11):
+            blocks.extend([str(number), "②"])
+        self.assertTrue(self.service._looks_like_answer_key_sheet(blocks))
+        self.assertFalse(self.service._looks_like_answer_key_sheet(blocks + ["다음 중 옳은 것은?"]))
+        self.assertFalse(self.service._looks_like_answer_key_sheet(blocks[:10]))
+
 
 if __name__ == "__main__":
     unittest.main()